@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Website Cloner Microbenchmarks
+
+Measures the cost of the hot per-URL helpers without touching the network.
+
+Usage:
+    python benchmark_cloner.py [--urls N] [--repeat N]
+"""
+
+import argparse
+import os
+import random
+import time
+import urllib.parse
+
+from website_cloner import AssetClassifier, WebsiteCloner
+
+def make_urls(count: int, seed: int = 1234):
+    """Build a synthetic mix of page and asset URLs with realistic repetition"""
+    rng = random.Random(seed)
+    suffixes = ['', '/', '.html', '.php', '.css', '.js', '.png', '.jpg', '.svg',
+                '.woff2', '.mp4', '.pdf', '.json', '.xml']
+    hosts = ['example.com', 'cdn.example.com', 'static.example.net']
+    unique = [
+        f"https://{rng.choice(hosts)}/section{rng.randint(0, 50)}/item{i}{rng.choice(suffixes)}"
+        + (f"?v={rng.randint(0, 9)}" if rng.random() < 0.2 else '')
+        for i in range(max(1, count // 4))
+    ]
+    # Every URL is looked at several times during a crawl
+    return [rng.choice(unique) for _ in range(count)]
+
+def legacy_checks(urls, asset_extensions, enabled_assets, base_domain):
+    """The per-URL scans used before AssetClassifier"""
+    hits = 0
+    for url in urls:
+        parsed_url = urllib.parse.urlparse(url)
+        if parsed_url.netloc == base_domain or parsed_url.netloc == '':
+            hits += 1
+        path = urllib.parse.urlparse(url).path.lower()
+        if not os.path.splitext(path)[1] or any(path.endswith(ext) for ext in asset_extensions['html']):
+            hits += 1
+        path = urllib.parse.urlparse(url).path.lower()
+        for asset_type in enabled_assets:
+            if any(path.endswith(ext) for ext in asset_extensions[asset_type]):
+                hits += 1
+                break
+    return hits
+
+def classifier_checks(urls, classifier, enabled_assets, base_domain):
+    """The same checks answered by AssetClassifier"""
+    hits = 0
+    for url in urls:
+        netloc = classifier.netloc(url)
+        if netloc == base_domain or netloc == '':
+            hits += 1
+        if classifier.is_html(url):
+            hits += 1
+        if classifier.classify(url) in enabled_assets:
+            hits += 1
+    return hits
+
+def bench(label, func, repeat):
+    """Run func repeat times and print the best wall-clock time"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<24} {best * 1000:10.2f} ms")
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description='Microbenchmarks for the website cloner')
+    parser.add_argument('--urls', type=int, default=200000, help='Number of URL lookups (default: 200000)')
+    parser.add_argument('--repeat', type=int, default=5, help='Repetitions per benchmark (default: 5)')
+    args = parser.parse_args()
+
+    cloner = WebsiteCloner()
+    enabled_assets = cloner.asset_extensions.keys()
+    urls = make_urls(args.urls)
+
+    print(f"URL classification ({args.urls} lookups, best of {args.repeat})")
+    print("-" * 40)
+    legacy = bench("extension scans", lambda: legacy_checks(
+        urls, cloner.asset_extensions, enabled_assets, 'example.com'), args.repeat)
+    # A fresh classifier per run so the parse cache has to warm up each time
+    fast = bench("AssetClassifier", lambda: classifier_checks(
+        urls, AssetClassifier(cloner.asset_extensions), enabled_assets, 'example.com'), args.repeat)
+    print(f"Speedup: {legacy / fast:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -12,12 +12,24 @@ from urllib.robotparser import RobotFileParser
 import time
 import re
 from bs4 import BeautifulSoup
+from website_cloner_ranges import RangeDownloader, RangesNotSupported, supports_ranges
+from website_cloner_writer import DiskWriter
+from website_cloner_traps import TrapDetector
+from website_cloner_network import WarmingAdapter
+from website_cloner_verify import VerifyReport, hash_files, verify_files
+from website_cloner_images import (LAZY_SRC_ATTRIBUTES, LAZY_SRCSET_ATTRIBUTES,
+                                   parse_srcset, select_variant, source_matches)
 from pathlib import Path
 import mimetypes
-from typing import Set, List, Dict, Optional
+from typing import Set, List, Dict, Optional, Tuple
 import threading
 from dataclasses import dataclass
+import functools
+import heapq
+import itertools
 import json
+import random
+from concurrent.futures import ThreadPoolExecutor
 
 @dataclass
 class CloneProgress:
@@ -25,9 +37,193 @@ class CloneProgress:
     total_files: int = 0
     downloaded_files: int = 0
     failed_files: int = 0
+    skipped_files: int = 0
+    deferred_files: int = 0
+    trapped_links: int = 0
+    duplicate_pages: int = 0
+    image_variants_skipped: int = 0
+    image_variants_measured: int = 0
+    image_bytes_saved: int = 0
+    downloaded_bytes: int = 0
+    write_queue_depth: int = 0
+    write_bytes_per_sec: float = 0.0
+    connection_ms_saved: float = 0.0
     current_file: str = ""
     status: str = "Starting..."
 
+class AssetClassifier:
+    """Classifies URLs into asset types using precompiled lookup tables"""
+    
+    # Content types that mimetypes does not map back to our extensions
+    CONTENT_TYPES = {
+        'text/html': 'html',
+        'application/xhtml+xml': 'html',
+        'text/css': 'css',
+        'text/javascript': 'js',
+        'application/javascript': 'js',
+        'application/x-javascript': 'js',
+        'application/font-woff': 'fonts',
+        'application/font-woff2': 'fonts',
+        'application/vnd.ms-fontobject': 'fonts',
+        'application/x-font-ttf': 'fonts',
+        'application/pdf': 'documents',
+        'application/msword': 'documents',
+        'application/rtf': 'documents',
+    }
+    
+    CONTENT_TYPE_PREFIXES = {
+        'image/': 'images',
+        'video/': 'videos',
+        'font/': 'fonts',
+    }
+    
+    def __init__(self, asset_extensions: Dict[str, List[str]], cache_size: int = 65536):
+        self.suffix_types: Dict[str, str] = {}
+        for asset_type, extensions in asset_extensions.items():
+            for ext in extensions:
+                self.suffix_types.setdefault(ext.lower(), asset_type)
+        
+        self.content_types = dict(self.CONTENT_TYPES)
+        for suffix, asset_type in self.suffix_types.items():
+            mime_type = mimetypes.types_map.get(suffix)
+            if mime_type:
+                self.content_types.setdefault(mime_type, asset_type)
+        
+        # Types learned from response headers for extensionless URLs
+        self.sniffed_types: Dict[str, str] = {}
+        self.split = functools.lru_cache(maxsize=cache_size)(self._split_url)
+    
+    @staticmethod
+    def _split_url(url: str) -> Tuple[str, str, str]:
+        """Parse a URL once into (netloc, lowercase path, suffix)"""
+        parsed_url = urllib.parse.urlparse(url)
+        path = parsed_url.path.lower()
+        dot = path.rfind('.')
+        suffix = path[dot:] if dot > path.rfind('/') else ''
+        return parsed_url.netloc, path, suffix
+    
+    def netloc(self, url: str) -> str:
+        """Return the network location of a URL"""
+        return self.split(url)[0]
+    
+    def has_extension(self, url: str) -> bool:
+        """Check if the URL path ends with a file extension"""
+        return bool(self.split(url)[2])
+    
+    def classify(self, url: str) -> Optional[str]:
+        """Return the asset type of a URL, or None if it is unknown"""
+        suffix = self.split(url)[2]
+        if suffix:
+            return self.suffix_types.get(suffix)
+        return self.sniffed_types.get(url)
+    
+    def is_html(self, url: str) -> bool:
+        """Check if URL points to an HTML page"""
+        asset_type = self.classify(url)
+        if asset_type is None:
+            # If no extension and nothing sniffed yet, assume HTML
+            return not self.has_extension(url)
+        return asset_type == 'html'
+    
+    def classify_content_type(self, content_type: str) -> Optional[str]:
+        """Map a Content-Type header value to an asset type"""
+        mime_type = content_type.split(';', 1)[0].strip().lower()
+        if not mime_type:
+            return None
+        asset_type = self.content_types.get(mime_type)
+        if asset_type:
+            return asset_type
+        for prefix, prefix_type in self.CONTENT_TYPE_PREFIXES.items():
+            if mime_type.startswith(prefix):
+                return prefix_type
+        return None
+    
+    def record_content_type(self, url: str, content_type: str) -> Optional[str]:
+        """Classify a URL from its response headers, remembering the result
+        for extensionless URLs"""
+        asset_type = self.classify(url)
+        if asset_type is None and not self.has_extension(url):
+            asset_type = self.classify_content_type(content_type)
+            if asset_type:
+                self.sniffed_types[url] = asset_type
+        return asset_type
+
+class CancellationToken:
+    """Thread-safe flag used to stop a running clone from another thread"""
+    
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+    
+    def cancel(self):
+        """Request cancellation and run any registered callbacks"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+    
+    def on_cancel(self, callback):
+        """Register a callback to run when cancel() is called"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+    
+    def sleep(self, seconds: float) -> bool:
+        """Sleep for up to the given time, waking early on cancellation.
+        
+        Returns True if the token was cancelled.
+        """
+        return self._event.wait(seconds) if seconds > 0 else self.cancelled
+
+class CrawlScheduler:
+    """Priority queue of pending fetches; lower priority values are fetched first"""
+    
+    PAGE = 'page'
+    ASSET = 'asset'
+    LARGE_ASSET = 'large_asset'
+    
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+        self._queued: Set[str] = set()
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+    
+    def push(self, url: str, kind: str, priority: int, depth: int = 0, force: bool = False) -> bool:
+        """Queue a URL unless it is already queued. Returns True if queued.
+        
+        Ties are broken by depth, then discovery order, so shallower pages
+        and their assets win over deeper ones.
+        """
+        if url in self._queued and not force:
+            return False
+        self._queued.add(url)
+        heapq.heappush(self._heap, (priority, depth, next(self._counter), url, kind))
+        return True
+    
+    def pop(self) -> Tuple[str, str, int]:
+        """Remove and return the next (url, kind, depth) to fetch"""
+        priority, depth, _, url, kind = heapq.heappop(self._heap)
+        return url, kind, depth
+    
+    def pending(self) -> List[str]:
+        """Return the queued URLs in fetch order"""
+        return [entry[3] for entry in sorted(self._heap)]
+
 class WebsiteCloner:
     """Main class for cloning websites"""
     
@@ -37,9 +233,15 @@ class WebsiteCloner:
             'User-Agent': 'Website-Cloner/1.0 (Educational Purpose)'
         })
         
+        # Cached DNS and pre-warmed connections, shared by every host
+        self.network = WarmingAdapter(pool_connections=32, pool_maxsize=8)
+        self.session.mount('http://', self.network)
+        self.session.mount('https://', self.network)
+        
         self.downloaded_urls: Set[str] = set()
         self.failed_urls: Set[str] = set()
-        self.url_queue: List[str] = []
+        self.skipped_urls: Dict[str, str] = {}  # url -> reason
+        self.scheduler = CrawlScheduler()
         self.progress = CloneProgress()
         self.base_domain = ""
         self.base_url = ""
@@ -49,6 +251,9 @@ class WebsiteCloner:
         self.respect_robots = True
         self.delay_between_requests = 1.0  # seconds
         self.progress_callback = None
+        self.event_callback = None
+        self.cancel_token = CancellationToken()
+        self._results_lock = threading.Lock()  # downloaded/failed bookkeeping vs. writer threads
         
         # File type mappings
         self.asset_extensions = {
@@ -62,15 +267,128 @@ class WebsiteCloner:
         }
         
         self.enabled_assets = ['html', 'css', 'js', 'images']
+        self.classifier = AssetClassifier(self.asset_extensions)
+        
+        # Size limits and budgets (None means unlimited)
+        self.max_asset_sizes: Dict[str, int] = {}  # asset type -> bytes
+        self.max_total_bytes: Optional[int] = None
+        self.max_duration: Optional[float] = None  # seconds
+        self.large_asset_threshold: Optional[int] = 5 * 1024 * 1024  # bytes, deferred to the end
+        
+        # Fetch order per asset type (lower first). Pages sit between the
+        # render-critical assets of the current page and bulky media.
+        self.asset_priorities: Dict[str, int] = {
+            'css': 0,
+            'js': 1,
+            'fonts': 2,
+            'images': 3,
+            'html': 5,
+            'documents': 7,
+            'videos': 8
+        }
+        self.above_fold_images = 6  # first images on a page keep the 'images' priority
+        self.below_fold_priority = 6  # later images and assets of unknown type
+        self.large_asset_priority = 10
+        self.chunk_size = 64 * 1024
+        self.start_time = 0.0
+        
+        # Files at least this large are fetched as parallel, resumable byte
+        # ranges when the server supports it (None disables)
+        self.range_download_threshold: Optional[int] = 16 * 1024 * 1024
+        self.range_segment_size = 4 * 1024 * 1024
+        self.range_workers = 4
+        
+        # Write-behind disk writer. Bodies up to write_behind_limit bytes are
+        # written by background threads; larger ones stream on the fetch thread.
+        self.writer: Optional[DiskWriter] = None
+        self.writer_threads = 2
+        self.write_queue_size = 64
+        self.write_behind_limit = 1024 * 1024
+        self.fsync_policy = 'none'  # 'none', 'batch' or 'always'
+        self.fsync_batch = 32
+        
+        # Crawler-trap detection: links matching a trap are not crawled
+        self.detect_traps = True
+        self.trap_detector = TrapDetector()
+        self.max_pages_per_pattern = 1000  # pages per generalized URL pattern
+        self.max_query_variants = 50  # distinct query strings per path
+        self.max_repeated_segments = 2  # e.g. /a/b/a/b/a/b
+        self.near_duplicate_distance = 3  # SimHash bits, at most 3
+        self.duplicates_per_trap = 5  # near-duplicates before a pattern is a trap
+        
+        # Responsive images: 'best' fetches the one srcset variant that suits
+        # the target display and rewrites srcset to it; 'all' fetches every variant
+        self.responsive_images = 'best'
+        self.target_viewport_width = 1280  # CSS pixels
+        self.target_dpr = 1.0
+        self.measure_image_savings = True  # HEAD skipped variants to report bytes saved
+        self.max_image_measurements = 200  # HEAD a sample this large and extrapolate
+        self.image_measurement_workers = 8
+        self.skipped_variants: Set[str] = set()
+        
+        # Connection pre-warming: once a page's assets are known, open
+        # connections to their hosts while earlier fetches are still running
+        self.preconnect_hosts = True
+        self.max_preconnects_per_page = 6
+        self.dns_ttl = 300.0  # seconds a resolved address is reused
+        self.preconnect_timeout = 10.0  # seconds before a warm-up gives up
+        self.page_urls: Set[str] = set()
+        
+        # Threads hashing files for the clone manifest and verify_clone (None: per CPU)
+        self.verify_workers: Optional[int] = None
     
     def clone_website(self, url: str, output_dir: str = "cloned_sites", 
                      max_depth: int = 2, asset_types: List[str] = None,
-                     progress_callback=None):
-        """Main method to clone a website"""
+                     progress_callback=None, max_total_bytes: Optional[int] = None,
+                     max_duration: Optional[float] = None,
+                     max_asset_sizes: Optional[Dict[str, int]] = None,
+                     cancel_token: Optional[CancellationToken] = None,
+                     event_callback=None):
+        """Main method to clone a website
+        
+        max_total_bytes and max_duration stop the crawl once that many bytes
+        have been downloaded or seconds have passed. max_asset_sizes maps asset
+        types to a per-file byte limit; larger files are skipped.
+        
+        Cancelling cancel_token (or calling cancel()) stops the clone early;
+        the files fetched so far and clone_info.json are kept.
+        
+        event_callback, if given, receives one dict per event: 'start',
+        'file' (url, type, bytes, latency_ms, write_queue), 'error', 'skipped'
+        and 'done'.
+        """
         
         self.progress_callback = progress_callback
+        self.event_callback = event_callback
         self.max_depth = max_depth
         self.enabled_assets = asset_types or ['html', 'css', 'js', 'images']
+        self.classifier = AssetClassifier(self.asset_extensions)
+        if max_total_bytes is not None:
+            self.max_total_bytes = max_total_bytes
+        if max_duration is not None:
+            self.max_duration = max_duration
+        if max_asset_sizes is not None:
+            self.max_asset_sizes = dict(max_asset_sizes)
+        self.downloaded_urls = set()
+        self.failed_urls = set()
+        self.skipped_urls = {}
+        self.scheduler = CrawlScheduler()
+        self.progress = CloneProgress()
+        self.start_time = time.monotonic()
+        self.cancel_token = cancel_token or CancellationToken()
+        self.cancel_token.on_cancel(self._abort_requests)
+        self.skipped_variants = set()
+        self.page_urls = set()
+        self.network.dns_cache.ttl = self.dns_ttl
+        self.network.preconnect_timeout = self.preconnect_timeout
+        self.network.stats.reset()
+        self.trap_detector = TrapDetector(
+            max_pages_per_pattern=self.max_pages_per_pattern,
+            max_query_variants=self.max_query_variants,
+            max_repeated_segments=self.max_repeated_segments,
+            near_duplicate_distance=self.near_duplicate_distance,
+            duplicates_per_trap=self.duplicates_per_trap
+        )
         
         # Normalize URL
         if not url.startswith(('http://', 'https://')):
@@ -92,9 +410,28 @@ class WebsiteCloner:
         # Initialize progress
         self.progress.status = "Starting clone..."
         self._update_progress()
+        self._emit_event('start', url=url, output_dir=self.output_dir)
         
         # Start cloning
-        self._clone_recursive(url, 0)
+        self.writer = DiskWriter(workers=self.writer_threads, max_queue=self.write_queue_size,
+                                 fsync=self.fsync_policy, fsync_batch=self.fsync_batch,
+                                 on_error=self._on_write_error)
+        try:
+            self.trap_detector.allow_link(url)
+            self.scheduler.push(url, CrawlScheduler.PAGE, self.asset_priorities.get('html', 0))
+            self._run_scheduler()
+            self._measure_image_savings()
+        finally:
+            # Everything queued is a complete file, so finish writing it
+            self.writer.close()
+        
+        if self.cancel_token.cancelled:
+            # Keep what was fetched and skip the slow link rewrite
+            self._save_clone_info()
+            self.progress.status = "Clone cancelled"
+            self._update_progress()
+            self._emit_done()
+            return self.output_dir
         
         # Convert links in HTML files
         self._convert_links_to_relative()
@@ -102,72 +439,182 @@ class WebsiteCloner:
         # Save clone information
         self._save_clone_info()
         
-        self.progress.status = "Clone completed!"
+        if self.clone_status() == 'failed':
+            self.progress.status = "Clone failed: the start page could not be downloaded"
+        else:
+            self.progress.status = "Clone completed!"
         self._update_progress()
+        self._emit_done()
         
         return self.output_dir
     
-    def _clone_recursive(self, url: str, depth: int):
-        """Recursively clone website pages and assets"""
+    def cancel(self):
+        """Stop the running clone as soon as possible"""
+        self.cancel_token.cancel()
+    
+    def clone_status(self) -> str:
+        """Outcome of the last clone: 'cancelled', 'failed' if the start page
+        could not be downloaded, or 'completed'"""
+        if self.cancel_token.cancelled:
+            return 'cancelled'
+        if not self.downloaded_urls or self.base_url in self.failed_urls:
+            return 'failed'
+        return 'completed'
+    
+    def _abort_requests(self):
+        """Interrupt the requests in flight so that blocked reads return early.
+        
+        Closing a response does not wake a thread blocked in recv(), and it
+        would block this thread until the body arrived, so the sockets
+        themselves are shut down. This also ends waits for response headers,
+        HEAD requests and range workers. Each fetch thread closes its own
+        response once its read fails.
+        """
+        self.network.abort()
+    
+    def _read_body(self, response) -> bytes:
+        """Read a streamed response body, stopping early on cancellation"""
+        chunks = []
+        for chunk in response.iter_content(chunk_size=self.chunk_size):
+            if self.cancel_token.cancelled:
+                break
+            chunks.append(chunk)
+        return b''.join(chunks)
+    
+    def _run_scheduler(self):
+        """Fetch queued pages and assets in priority order until done or out of budget"""
+        while self.scheduler and not self.cancel_token.cancelled:
+            if self._budget_exhausted():
+                break
+            
+            url, kind, depth = self.scheduler.pop()
+            if url in self.downloaded_urls or url in self.skipped_urls:
+                continue
+            
+            if kind == CrawlScheduler.PAGE:
+                self._clone_page(url, depth)
+                # Rate limiting
+                self.cancel_token.sleep(self.delay_between_requests)
+            else:
+                if kind == CrawlScheduler.LARGE_ASSET:
+                    self.progress.deferred_files -= 1
+                self._download_assets([url], defer_large=kind != CrawlScheduler.LARGE_ASSET)
+    
+    def _clone_page(self, url: str, depth: int):
+        """Download a page, save it and schedule its assets and links"""
         
         if depth > self.max_depth or url in self.downloaded_urls:
             return
         
-        if not self._is_same_domain(url):
+        if not self._is_same_domain(url) or url in self.skipped_urls:
             return
         
         try:
             self.progress.current_file = url
             self.progress.status = f"Downloading: {os.path.basename(url) or 'index'}"
             self._update_progress()
+            started = time.monotonic()
             
             # Download the page
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                
+                content_type = response.headers.get('content-type', '').lower()
+                asset_type = self.classifier.record_content_type(url, content_type)
+                
+                # Check the declared size before reading the body
+                reason = self._check_size(asset_type, self._content_length(response))
+                if reason:
+                    self._skip_url(url, reason)
+                    return
+                content = self._read_body(response)
+            if self.cancel_token.cancelled:
+                return
+            self.progress.downloaded_bytes += len(content)
             
             # Save the file
             local_path = self._url_to_local_path(url)
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
-            
-            content_type = response.headers.get('content-type', '').lower()
             
             if 'text/html' in content_type:
                 # Process HTML content
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(content, 'html.parser')
                 
-                # Extract and download assets
+                # Extraction rewrites responsive image markup, so it runs first
                 assets = self._extract_assets(soup, url)
-                self._download_assets(assets)
+                if self.preconnect_hosts:
+                    self._preconnect(assets)
+                
+                # Save the page before anything it references
+                self.writer.write(local_path, str(soup).encode('utf-8'), url)
                 
-                # Extract links for further crawling
-                if depth < self.max_depth:
-                    links = self._extract_links(soup, url)
-                    for link in links:
-                        if link not in self.downloaded_urls:
-                            time.sleep(self.delay_between_requests)
-                            self._clone_recursive(link, depth + 1)
+                # Schedule assets ahead of deeper pages
+                self._schedule_assets(assets, depth)
                 
-                # Save processed HTML
-                with open(local_path, 'w', encoding='utf-8') as f:
-                    f.write(str(soup))
+                # Schedule links for further crawling, unless this page is a
+                # near-duplicate whose links lead further into a trap
+                if depth < self.max_depth and not self._is_duplicate_page(url, soup):
+                    for link in self._extract_links(soup, url):
+                        if link not in self.downloaded_urls and self._allow_link(link):
+                            self.scheduler.push(link, CrawlScheduler.PAGE,
+                                                self.asset_priorities.get('html', 0), depth + 1)
             else:
                 # Save binary content as-is
-                with open(local_path, 'wb') as f:
-                    f.write(response.content)
-            
-            self.downloaded_urls.add(url)
-            self.progress.downloaded_files += 1
-            self._update_progress()
+                self.writer.write(local_path, content, url)
             
-            # Rate limiting
-            time.sleep(self.delay_between_requests)
+            if self._mark_downloaded(url):
+                self.page_urls.add(url)
+                self._update_progress()
+                self._emit_file(url, asset_type, len(content), started)
             
         except Exception as e:
+            if self.cancel_token.cancelled:
+                return
             print(f"Failed to download {url}: {e}")
+            self._emit_event('error', url=url, error=str(e))
             self.failed_urls.add(url)
             self.progress.failed_files += 1
             self._update_progress()
     
+    def _is_duplicate_page(self, url: str, soup: BeautifulSoup) -> bool:
+        """Check if a page's text nearly duplicates a page already crawled"""
+        if not self.detect_traps:
+            return False
+        
+        duplicate = self.trap_detector.check_page(url, soup.get_text(' '))
+        if duplicate:
+            self.progress.duplicate_pages += 1
+            self._emit_event('duplicate', url=url, original=self.trap_detector.duplicate_pages[url])
+        return duplicate
+    
+    def _allow_link(self, url: str) -> bool:
+        """Check a discovered link against the crawler-trap rules"""
+        if not self.detect_traps or self.trap_detector.allow_link(url):
+            return True
+        self.progress.trapped_links = len(self.trap_detector.trapped_urls)
+        return False
+    
+    def _preconnect(self, asset_urls: List[str]):
+        """Warm up connections to the hosts of assets that will be fetched"""
+        pending = [asset_url for asset_url in asset_urls
+                   if asset_url not in self.downloaded_urls and self._should_download_asset(asset_url)]
+        self.network.preconnect(pending, limit=self.max_preconnects_per_page, session=self.session)
+    
+    def _schedule_assets(self, asset_urls: List[str], depth: int):
+        """Queue a page's assets by type priority, images in document order"""
+        images_seen = 0
+        for asset_url in asset_urls:
+            if asset_url in self.downloaded_urls:
+                continue
+            
+            asset_type = self.classifier.classify(asset_url)
+            priority = self.asset_priorities.get(asset_type, self.below_fold_priority)
+            if asset_type == 'images':
+                images_seen += 1
+                if images_seen > self.above_fold_images:
+                    priority = self.below_fold_priority
+            
+            self.scheduler.push(asset_url, CrawlScheduler.ASSET, priority, depth)
+    
     def _extract_assets(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Extract asset URLs from HTML"""
         assets = []
@@ -188,10 +635,12 @@ class WebsiteCloner:
         
         # Images
         if 'images' in self.enabled_assets:
-            for img in soup.find_all('img', src=True):
-                src = img.get('src')
-                if src:
-                    assets.append(urllib.parse.urljoin(base_url, src))
+            # In document order, so that the first images keep their priority
+            for element in soup.find_all(['picture', 'img']):
+                if element.name == 'picture':
+                    assets.extend(self._extract_picture_sources(element, base_url))
+                elif element.parent is None or element.parent.name != 'picture':
+                    assets.extend(self._extract_image_sources(element, base_url))
             
             # Background images in style attributes
             for element in soup.find_all(style=True):
@@ -202,13 +651,144 @@ class WebsiteCloner:
         
         # Fonts
         if 'fonts' in self.enabled_assets:
-            for link in soup.find_all('link'):
-                href = link.get('href', '')
-                if any(ext in href.lower() for ext in self.asset_extensions['fonts']):
-                    assets.append(urllib.parse.urljoin(base_url, href))
+            for link in soup.find_all('link', href=True):
+                font_url = urllib.parse.urljoin(base_url, link.get('href'))
+                if self.classifier.classify(font_url) == 'fonts':
+                    assets.append(font_url)
+        
+        # Videos and documents, embedded or linked
+        linked_types = {'videos', 'documents'}.intersection(self.enabled_assets)
+        if linked_types:
+            for element in soup.find_all(['video', 'source', 'a', 'embed']):
+                ref = element.get('src') or element.get('href')
+                if ref:
+                    ref_url = urllib.parse.urljoin(base_url, ref)
+                    if self.classifier.classify(ref_url) in linked_types:
+                        assets.append(ref_url)
         
         return assets
     
+    def _extract_image_sources(self, element, base_url: str) -> List[str]:
+        """Return the image URLs to fetch for an img or picture source element.
+        
+        Lazy-load attributes are moved to src/srcset so that pages render
+        offline without their loader script. With the 'best' policy, srcset
+        is rewritten to the single chosen variant.
+        """
+        for attribute in LAZY_SRC_ATTRIBUTES:
+            if element.get(attribute):
+                element['src'] = element[attribute]
+                del element[attribute]
+                break
+        for attribute in LAZY_SRCSET_ATTRIBUTES:
+            if element.get(attribute):
+                element['srcset'] = element[attribute]
+                del element[attribute]
+                break
+        
+        src = element.get('src') if element.name == 'img' else None
+        if src and src.startswith('data:'):
+            src = None
+        candidates = [candidate for candidate in parse_srcset(element.get('srcset', ''))
+                      if not candidate[0].startswith('data:')]
+        
+        if not candidates or self.responsive_images == 'all':
+            urls = [candidate[0] for candidate in candidates] + ([src] if src else [])
+            return [urllib.parse.urljoin(base_url, url) for url in urls]
+        
+        chosen, _ = select_variant(candidates, element.get('sizes'),
+                                   self.target_viewport_width, self.target_dpr)
+        if element.name == 'img':
+            # A single src renders the same everywhere and needs no sizes
+            element['src'] = chosen
+            del element['srcset']
+            if element.get('sizes'):
+                del element['sizes']
+        else:
+            element['srcset'] = chosen
+            if element.get('sizes'):
+                del element['sizes']
+        
+        chosen_url = urllib.parse.urljoin(base_url, chosen)
+        for url in [candidate[0] for candidate in candidates] + ([src] if src else []):
+            variant_url = urllib.parse.urljoin(base_url, url)
+            if variant_url != chosen_url:
+                self.skipped_variants.add(variant_url)
+        return [chosen_url]
+    
+    def _extract_picture_sources(self, picture, base_url: str) -> List[str]:
+        """Return the image URLs to fetch for a <picture> element.
+        
+        With the 'best' policy only the source a browser would use is
+        fetched: the first one whose media and type match, else the <img>.
+        The picture is reduced to an <img> showing that variant, and the
+        other sources count as skipped variants.
+        """
+        sources = picture.find_all('source', recursive=False)
+        img = picture.find('img')
+        elements = sources + ([img] if img is not None else [])
+        if self.responsive_images == 'all':
+            urls = []
+            for element in elements:
+                urls.extend(self._extract_image_sources(element, base_url))
+            return urls
+        
+        chosen = next((source for source in sources
+                       if source_matches(source.get('media'), source.get('type'), self.target_viewport_width)),
+                      img)
+        if chosen is None:
+            return []
+        
+        urls = []
+        for element in elements:
+            element_urls = self._extract_image_sources(element, base_url)
+            if element is chosen:
+                urls = element_urls
+            else:
+                self.skipped_variants.update(element_urls)
+        
+        if img is not None and chosen is not img:
+            img['src'] = chosen['srcset'] if chosen.get('srcset') else img.get('src', '')
+            for attribute in ('srcset', 'sizes'):
+                if img.get(attribute):
+                    del img[attribute]
+        for source in sources:
+            if img is not None or source is not chosen:
+                source.decompose()
+        return urls
+    
+    def _measure_image_savings(self):
+        """Report how many bytes the skipped image variants would have cost"""
+        # A variant chosen on another page was downloaded after all
+        skipped = [url for url in self.skipped_variants if url not in self.downloaded_urls]
+        self.progress.image_variants_skipped = len(skipped)
+        if not skipped or not self.measure_image_savings:
+            return
+        
+        # A sample is enough for an estimate. HEAD requests transfer no bodies,
+        # so they run in parallel without the crawl's rate limit.
+        sample = skipped
+        if self.max_image_measurements is not None and len(skipped) > self.max_image_measurements:
+            sample = random.sample(skipped, self.max_image_measurements)
+        self.progress.status = f"Measuring {len(sample)} of {len(skipped)} skipped image variants..."
+        self._update_progress()
+        
+        def measure(url):
+            if self.cancel_token.cancelled or self._check_time_budget():
+                return None
+            try:
+                with self.session.head(url, timeout=30, allow_redirects=True) as response:
+                    return self._content_length(response)
+            except Exception:
+                return None
+        
+        with ThreadPoolExecutor(max_workers=self.image_measurement_workers) as executor:
+            sizes = [size for size in executor.map(measure, sample) if size is not None]
+        if sizes:
+            self.progress.image_variants_measured = len(sizes)
+            self.progress.image_bytes_saved = round(sum(sizes) * len(skipped) / len(sizes))
+        self._update_progress()
+    
     def _extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Extract page links for further crawling"""
         links = []
@@ -223,12 +803,18 @@ class WebsiteCloner:
         
         return links
     
-    def _download_assets(self, asset_urls: List[str]):
+    def _download_assets(self, asset_urls: List[str], defer_large: bool = True):
         """Download asset files"""
         for asset_url in asset_urls:
-            if asset_url in self.downloaded_urls:
+            if self.cancel_token.cancelled:
+                break
+            
+            if asset_url in self.downloaded_urls or asset_url in self.skipped_urls:
                 continue
             
+            if self._budget_exhausted():
+                break
+            
             try:
                 if not self._should_download_asset(asset_url):
                     continue
@@ -237,53 +823,243 @@ class WebsiteCloner:
                 self.progress.status = f"Downloading asset: {os.path.basename(asset_url)}"
                 self._update_progress()
                 
-                response = self.session.get(asset_url, timeout=30)
-                response.raise_for_status()
-                
-                local_path = self._url_to_local_path(asset_url)
-                os.makedirs(os.path.dirname(local_path), exist_ok=True)
-                
-                with open(local_path, 'wb') as f:
-                    f.write(response.content)
-                
-                self.downloaded_urls.add(asset_url)
-                self.progress.downloaded_files += 1
-                self._update_progress()
-                
-                time.sleep(self.delay_between_requests / 2)  # Shorter delay for assets
+                if self._download_asset(asset_url, defer_large):
+                    self.cancel_token.sleep(self.delay_between_requests / 2)  # Shorter delay for assets
                 
             except Exception as e:
+                if self.cancel_token.cancelled:
+                    break
                 print(f"Failed to download asset {asset_url}: {e}")
+                self._emit_event('error', url=asset_url, error=str(e))
                 self.failed_urls.add(asset_url)
                 self.progress.failed_files += 1
                 self._update_progress()
     
-    def _should_download_asset(self, url: str) -> bool:
-        """Check if an asset should be downloaded based on file type"""
-        parsed_url = urllib.parse.urlparse(url)
-        path = parsed_url.path.lower()
+    def _download_asset(self, asset_url: str, defer_large: bool = True) -> bool:
+        """Stream a single asset to disk, enforcing size limits and budgets.
+        
+        Returns True if the asset was saved.
+        """
+        started = time.monotonic()
+        with self.session.get(asset_url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            
+            # Extensionless URLs are classified from the response headers
+            asset_type = self.classifier.record_content_type(
+                asset_url, response.headers.get('content-type', ''))
+            if asset_type not in self.enabled_assets:
+                return False
+            
+            # Early Content-Length check, before any of the body is read
+            size = self._content_length(response)
+            reason = self._check_size(asset_type, size)
+            if reason:
+                self._skip_url(asset_url, reason)
+                return False
+            
+            if (defer_large and size is not None and self.large_asset_threshold is not None
+                    and size > self.large_asset_threshold):
+                self.scheduler.push(asset_url, CrawlScheduler.LARGE_ASSET,
+                                    self.large_asset_priority, force=True)
+                self.progress.deferred_files += 1
+                self._update_progress()
+                return False
+            
+            local_path = self._url_to_local_path(asset_url)
+            self.writer.ensure_dir(os.path.dirname(local_path))
+            
+            if (size is not None and self.range_download_threshold is not None
+                    and size >= self.range_download_threshold and supports_ranges(response.headers)):
+                response.close()
+                written = self._download_ranges(asset_url, asset_type, local_path, size,
+                                                response.headers)
+                if written is None:
+                    return False
+            else:
+                written = self._stream_to_file(response, asset_url, asset_type, local_path)
+                if written is None:
+                    return False
         
-        for asset_type in self.enabled_assets:
-            if any(path.endswith(ext) for ext in self.asset_extensions[asset_type]):
-                return True
+        self.progress.downloaded_bytes += written
+        if not self._mark_downloaded(asset_url):
+            return False
+        self._update_progress()
+        self._emit_file(asset_url, asset_type, written, started)
+        return True
+    
+    def _stream_to_file(self, response, asset_url: str, asset_type: Optional[str],
+                        local_path: str) -> Optional[int]:
+        """Write a streamed response body to disk.
         
-        return False
+        Small bodies are buffered and handed to the disk writer; bodies over
+        write_behind_limit are written directly as they arrive.
+        Returns the number of bytes read, or None if the file was dropped.
+        """
+        # Servers may omit or understate Content-Length, so keep counting
+        written = 0
+        reason = None
+        chunks = []
+        f = None
+        try:
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                if self.cancel_token.cancelled:
+                    break
+                written += len(chunk)
+                reason = self._check_size(asset_type, written) or self._check_time_budget()
+                if reason:
+                    break
+                if f is None and written > self.write_behind_limit:
+                    # Too large to buffer; stream the rest on this thread
+                    f = open(local_path, 'wb')
+                    f.writelines(chunks)
+                    chunks = []
+                if f is None:
+                    chunks.append(chunk)
+                else:
+                    f.write(chunk)
+        except Exception:
+            if f is not None:
+                f.close()
+                os.remove(local_path)
+            raise
+        
+        if f is not None:
+            f.close()
+        
+        if reason or self.cancel_token.cancelled:
+            # Never leave a truncated file behind
+            if f is not None:
+                os.remove(local_path)
+            if reason:
+                self._skip_url(asset_url, reason)
+            return None
+        
+        if f is None:
+            self.writer.write(local_path, b''.join(chunks), asset_url)
+        return written
+    
+    def _download_ranges(self, asset_url: str, asset_type: Optional[str], local_path: str,
+                         size: int, headers) -> Optional[int]:
+        """Fetch a large file as parallel byte ranges, resuming earlier progress.
+        
+        Returns the number of bytes fetched by this run, or None if stopped
+        early. Finished ranges stay on disk for the next attempt. If the
+        server will not serve ranges after all, the file is fetched whole.
+        """
+        self.progress.status = f"Downloading in ranges: {os.path.basename(asset_url)}"
+        self._update_progress()
+        
+        downloader = RangeDownloader(
+            self.session, asset_url, local_path, size, headers,
+            segment_size=self.range_segment_size,
+            workers=self.range_workers,
+            chunk_size=self.chunk_size,
+            should_stop=lambda: self.cancel_token.cancelled or self._check_time_budget() is not None
+        )
+        try:
+            complete = downloader.download()
+        except RangesNotSupported:
+            self.progress.downloaded_bytes += downloader.fetched_bytes
+            with self.session.get(asset_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                return self._stream_to_file(response, asset_url, asset_type, local_path)
+        except Exception:
+            self.progress.downloaded_bytes += downloader.fetched_bytes
+            raise
+        
+        if not complete:
+            self.progress.downloaded_bytes += downloader.fetched_bytes
+            reason = self._check_time_budget()
+            if reason:
+                self._skip_url(asset_url, reason)
+            return None
+        return downloader.fetched_bytes
+    
+    def _content_length(self, response) -> Optional[int]:
+        """Return the declared body size of a response, if any"""
+        try:
+            return int(response.headers['content-length'])
+        except (KeyError, ValueError):
+            return None
+    
+    def _check_size(self, asset_type: Optional[str], size: Optional[int]) -> Optional[str]:
+        """Return a reason to skip a file of the given size, or None"""
+        if size is None:
+            return None
+        
+        limit = self.max_asset_sizes.get(asset_type)
+        if limit is not None and size > limit:
+            return f"{asset_type} size {size} exceeds limit of {limit} bytes"
+        
+        if self.max_total_bytes is not None and self.progress.downloaded_bytes + size > self.max_total_bytes:
+            return f"size {size} exceeds remaining byte budget"
+        
+        return None
+    
+    def _check_time_budget(self) -> Optional[str]:
+        """Return a reason to stop if the time budget is spent, or None"""
+        if self.max_duration is not None and time.monotonic() - self.start_time > self.max_duration:
+            return "time budget exhausted"
+        return None
+    
+    def _budget_exhausted(self) -> bool:
+        """Check if the byte or time budget of this clone is spent"""
+        reason = self._check_time_budget()
+        if not reason and self.max_total_bytes is not None and self.progress.downloaded_bytes >= self.max_total_bytes:
+            reason = "byte budget exhausted"
+        
+        if reason and not self.progress.status.startswith("Budget"):
+            self.progress.status = f"Budget reached ({reason}), finishing..."
+            self._update_progress()
+        return reason is not None
+    
+    def _mark_downloaded(self, url: str) -> bool:
+        """Record a fetched URL as downloaded. Returns False if a writer
+        thread already failed to save it."""
+        with self._results_lock:
+            if url in self.failed_urls:
+                return False
+            self.downloaded_urls.add(url)
+            self.progress.downloaded_files += 1
+            return True
+    
+    def _on_write_error(self, path: str, url: str, error: Exception):
+        """Called from a writer thread when a queued file could not be saved"""
+        print(f"Failed to write {path}: {error}")
+        self._emit_event('error', url=url, error=f"write failed: {error}")
+        # The fetch thread may not have marked the URL yet; _mark_downloaded
+        # then sees it in failed_urls and leaves it out
+        with self._results_lock:
+            if url in self.downloaded_urls:
+                self.downloaded_urls.discard(url)
+                self.progress.downloaded_files -= 1
+            self.failed_urls.add(url)
+            self.progress.failed_files += 1
+    
+    def _skip_url(self, url: str, reason: str):
+        """Record a URL that was deliberately not downloaded"""
+        print(f"Skipped {url}: {reason}")
+        self.skipped_urls[url] = reason
+        self.progress.skipped_files += 1
+        self._update_progress()
+        self._emit_event('skipped', url=url, reason=reason)
+    
+    def _should_download_asset(self, url: str) -> bool:
+        """Check if an asset should be downloaded based on file type"""
+        asset_type = self.classifier.classify(url)
+        if asset_type is None:
+            # Extensionless URLs are fetched and classified by content type
+            return not self.classifier.has_extension(url)
+        return asset_type in self.enabled_assets
     
     def _is_same_domain(self, url: str) -> bool:
         """Check if URL belongs to the same domain"""
-        parsed_url = urllib.parse.urlparse(url)
-        return parsed_url.netloc == self.base_domain or parsed_url.netloc == ''
+        netloc = self.classifier.netloc(url)
+        return netloc == self.base_domain or netloc == ''
     
     def _is_html_page(self, url: str) -> bool:
         """Check if URL points to an HTML page"""
-        parsed_url = urllib.parse.urlparse(url)
-        path = parsed_url.path.lower()
-        
-        # If no extension, assume HTML
-        if not os.path.splitext(path)[1]:
-            return True
-        
-        return any(path.endswith(ext) for ext in self.asset_extensions['html'])
+        return self.classifier.is_html(url)
     
     def _url_to_local_path(self, url: str) -> str:
         """Convert URL to local file path"""
@@ -345,6 +1121,18 @@ class WebsiteCloner:
                         else:
                             element['src'] = local_path
             
+            # Convert responsive image candidates
+            for element in soup.find_all(['img', 'source'], srcset=True):
+                candidates = parse_srcset(element['srcset'])
+                converted = []
+                for url, descriptor in candidates:
+                    if url.startswith(('http://', 'https://')):
+                        url = self._convert_url_to_relative(url, file_path) or url
+                        # Commas would split the candidate when read back
+                        url = url.replace(',', '%2C')
+                    converted.append(f"{url} {descriptor}".strip())
+                element['srcset'] = ', '.join(converted)
+            
             # Save modified content
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(str(soup))
@@ -380,21 +1168,200 @@ class WebsiteCloner:
             'enabled_assets': self.enabled_assets,
             'downloaded_files': len(self.downloaded_urls),
             'failed_files': len(self.failed_urls),
+            'skipped_files': len(self.skipped_urls),
+            'downloaded_bytes': self.progress.downloaded_bytes,
             'downloaded_urls': list(self.downloaded_urls),
             'failed_urls': list(self.failed_urls),
+            'skipped_urls': self.skipped_urls,
+            'cancelled': self.cancel_token.cancelled,
+            'duplicate_pages': self.trap_detector.duplicate_pages,
+            'trap_patterns': sorted(self.trap_detector.trap_patterns),
+            'trapped_links': len(self.trap_detector.trapped_urls),
+            'responsive_images': {
+                'policy': self.responsive_images,
+                'variants_skipped': self.progress.image_variants_skipped,
+                'variants_measured': self.progress.image_variants_measured,
+                'bytes_saved': self.progress.image_bytes_saved
+            },
+            'connections': {
+                'saved_ms': round(self.progress.connection_ms_saved, 1),
+                'saved_ms_per_page': self._saved_ms_per_page(),
+                'hosts': self.network.stats.summary()
+            },
+            'pending_urls': self.scheduler.pending(),
+            # A cancelled clone should stop quickly, so it records sizes only
+            'files': self._build_manifest(self.downloaded_urls,
+                                          hashed=not self.cancel_token.cancelled),
             'clone_date': time.strftime('%Y-%m-%d %H:%M:%S')
         }
-        
+        self._write_clone_info(info)
+    
+    def _write_clone_info(self, info: Dict):
+        """Replace clone_info.json atomically"""
         info_path = os.path.join(self.output_dir, 'clone_info.json')
-        with open(info_path, 'w') as f:
+        temp_path = info_path + '.tmp'
+        with open(temp_path, 'w') as f:
             json.dump(info, f, indent=2)
+        os.replace(temp_path, info_path)
+    
+    def _build_manifest(self, urls, hashed: bool = True) -> Dict[str, Dict]:
+        """Record the local path, size and SHA-256 of each saved URL
+        
+        Without hashed, only sizes are recorded; verification can then find
+        missing and truncated files but reports the rest as unverified.
+        """
+        paths = {url: self._url_to_local_path(url) for url in urls}
+        if hashed:
+            hashes = hash_files(paths.values(), self.verify_workers)
+        else:
+            hashes = {}
+            for path in paths.values():
+                try:
+                    hashes[path] = (os.stat(path).st_size, None)
+                except OSError:
+                    pass
+        manifest = {}
+        for url, path in sorted(paths.items()):
+            if path not in hashes:
+                continue
+            size, digest = hashes[path]
+            manifest[url] = {
+                'path': os.path.relpath(path, self.output_dir).replace(os.sep, '/'),
+                'kind': CrawlScheduler.PAGE if url in self.page_urls else CrawlScheduler.ASSET,
+                'type': self.classifier.classify(url),
+                'size': size
+            }
+            if digest:
+                manifest[url]['sha256'] = digest
+        return manifest
+    
+    def verify_clone(self, clone_dir: str, repair: bool = False,
+                     event_callback=None) -> VerifyReport:
+        """Check an existing clone against the sizes and hashes in its
+        clone_info.json
+        
+        With repair, missing, truncated and modified files are fetched again,
+        and only those; their manifest entries are then updated. Clones saved
+        before hashes were recorded can only be checked for missing files.
+        """
+        with open(os.path.join(clone_dir, 'clone_info.json'), 'r') as f:
+            info = json.load(f)
+        
+        self.event_callback = event_callback
+        self.output_dir = clone_dir
+        self.start_time = time.monotonic()
+        self.classifier = AssetClassifier(self.asset_extensions)
+        files = info.get('files')
+        if files is None:
+            files = {url: {'path': os.path.relpath(self._url_to_local_path(url), clone_dir).replace(os.sep, '/')}
+                     for url in info.get('downloaded_urls', [])}
+        
+        report = verify_files(clone_dir, files, self.verify_workers)
+        for url in report.damaged():
+            self._emit_event('damaged', url=url, path=files[url]['path'], problem=report.problem(url))
+        
+        if repair and report.damaged():
+            self._repair_clone(info, files, report)
+        
+        self._emit_event('verified', output_dir=clone_dir, checked=report.checked, intact=report.intact,
+                         missing=len(report.missing), truncated=len(report.truncated),
+                         modified=len(report.modified), unverified=len(report.unverified),
+                         repaired=len(report.repaired), repair_failed=len(report.repair_failed),
+                         bytes_hashed=report.bytes_hashed,
+                         elapsed_s=round(time.monotonic() - self.start_time, 3))
+        return report
+    
+    def _repair_clone(self, info: Dict, files: Dict[str, Dict], report: VerifyReport):
+        """Refetch the damaged files of a clone and update its manifest"""
+        damaged = report.damaged()
+        self.base_url = info.get('base_url', '')
+        self.base_domain = info.get('base_domain', '')
+        self.max_depth = info.get('max_depth', self.max_depth)
+        self.enabled_assets = info.get('enabled_assets', self.enabled_assets)
+        self.downloaded_urls = set(files) - set(damaged)
+        self.failed_urls = set()
+        self.skipped_urls = {}
+        self.scheduler = CrawlScheduler()
+        self.progress = CloneProgress()
+        self.page_urls = set()
+        self.network.stats.reset()
+        
+        # Map extensionless URLs to the same local files as the original clone
+        for url, entry in files.items():
+            if entry.get('type') and not self.classifier.has_extension(url):
+                self.classifier.sniffed_types[url] = entry['type']
+        
+        self.writer = DiskWriter(workers=self.writer_threads, max_queue=self.write_queue_size,
+                                 fsync=self.fsync_policy, fsync_batch=self.fsync_batch,
+                                 on_error=self._on_write_error)
+        try:
+            for url in damaged:
+                if self.cancel_token.cancelled:
+                    break
+                entry = files[url]
+                is_page = entry['kind'] == CrawlScheduler.PAGE if 'kind' in entry else self._is_html_page(url)
+                if is_page:
+                    # Fetched at full depth so that its links are not crawled again
+                    self._clone_page(url, self.max_depth)
+                else:
+                    self._download_assets([url], defer_large=False)
+        finally:
+            self.writer.close()
+        
+        repaired = [url for url in damaged if url in self.downloaded_urls]
+        for url in repaired:
+            local_path = self._url_to_local_path(url)
+            if url in self.page_urls and local_path.endswith('.html'):
+                self._convert_file_links(local_path)
+        
+        files.update(self._build_manifest(repaired))
+        report.repaired = repaired
+        report.repair_failed = [url for url in damaged if url not in self.downloaded_urls]
+        info['files'] = files
+        self._write_clone_info(info)
     
     def _update_progress(self):
         """Update progress information"""
-        self.progress.total_files = len(self.downloaded_urls) + len(self.failed_urls) + len(self.url_queue)
+        self.progress.total_files = len(self.downloaded_urls) + len(self.failed_urls) + len(self.scheduler)
+        if self.writer:
+            stats = self.writer.stats()
+            self.progress.write_queue_depth = stats.queue_depth
+            self.progress.write_bytes_per_sec = stats.bytes_per_second
+        self.progress.connection_ms_saved = self.network.stats.saved_ms()
         
         if self.progress_callback:
             self.progress_callback(self.progress)
+    
+    def _emit_event(self, event: str, **data):
+        """Send a structured event to the event callback, if any"""
+        if self.event_callback:
+            self.event_callback({'event': event, 'time': round(time.time(), 3), **data})
+    
+    def _emit_file(self, url: str, asset_type: Optional[str], size: int, started: float):
+        """Report a saved file with its size and fetch latency"""
+        self._emit_event('file', url=url, type=asset_type, bytes=size,
+                         latency_ms=round((time.monotonic() - started) * 1000, 1),
+                         write_queue=self.progress.write_queue_depth)
+    
+    def _saved_ms_per_page(self) -> float:
+        """Average connection setup time avoided per cloned page"""
+        if not self.page_urls:
+            return 0.0
+        return round(self.progress.connection_ms_saved / len(self.page_urls), 1)
+    
+    def _emit_done(self):
+        """Report the final totals of a clone"""
+        self._emit_event('done', status=self.clone_status(),
+                         output_dir=self.output_dir,
+                         downloaded_files=self.progress.downloaded_files,
+                         failed_files=self.progress.failed_files,
+                         skipped_files=self.progress.skipped_files,
+                         downloaded_bytes=self.progress.downloaded_bytes,
+                         write_bytes_per_sec=round(self.progress.write_bytes_per_sec),
+                         image_bytes_saved=self.progress.image_bytes_saved,
+                         connection_ms_saved=round(self.progress.connection_ms_saved, 1),
+                         connection_ms_saved_per_page=self._saved_ms_per_page(),
+                         elapsed_s=round(time.monotonic() - self.start_time, 3))
 
 # Example usage
 if __name__ == "__main__":
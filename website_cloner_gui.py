@@ -10,7 +10,7 @@ from tkinter import ttk, filedialog, messagebox
 import threading
 import os
 import webbrowser
-from website_cloner import WebsiteCloner, CloneProgress
+from website_cloner import WebsiteCloner, CloneProgress, CancellationToken
 
 class WebsiteClonerGUI:
     def __init__(self, root):
@@ -20,6 +20,7 @@ class WebsiteClonerGUI:
         
         self.cloner = WebsiteCloner()
         self.current_thread = None
+        self.cancel_token = None
         self.is_cloning = False
         
         self.setup_ui()
@@ -196,6 +197,7 @@ class WebsiteClonerGUI:
         self.stop_button.config(state=tk.NORMAL)
         self.open_button.config(state=tk.DISABLED)
         self.is_cloning = True
+        self.cancel_token = CancellationToken()
         
         # Start cloning in separate thread
         self.current_thread = threading.Thread(
@@ -208,11 +210,13 @@ class WebsiteClonerGUI:
     def stop_cloning(self):
         """Stop the cloning process"""
         self.is_cloning = False
+        if self.cancel_token:
+            self.cancel_token.cancel()
         self.log_message("Stopping clone operation...")
         self.status_var.set("Stopping...")
         
-        # Reset button states
-        self.start_button.config(state=tk.NORMAL)
+        # Start comes back in _clone_stopped, once the worker has saved
+        # clone_info.json and left clone_website
         self.stop_button.config(state=tk.DISABLED)
     
     def _clone_worker(self, url, output_dir, max_depth, asset_types):
@@ -223,15 +227,22 @@ class WebsiteClonerGUI:
                 output_dir=output_dir,
                 max_depth=max_depth,
                 asset_types=asset_types,
-                progress_callback=self._progress_callback
+                progress_callback=self._progress_callback,
+                cancel_token=self.cancel_token
             )
             
-            if self.is_cloning:  # Only show success if not stopped
+            if self.is_cloning and self.cloner.clone_status() == 'failed':
+                self.root.after(0, lambda: self._clone_failed(f"Could not download {url}"))
+            elif self.is_cloning:  # Only show success if not stopped
                 self.root.after(0, lambda: self._clone_completed(result_dir))
+            else:
+                self.root.after(0, lambda: self._clone_stopped(result_dir))
                 
         except Exception as e:
             if self.is_cloning:  # Only show error if not stopped
                 self.root.after(0, lambda: self._clone_failed(str(e)))
+            else:
+                self.root.after(0, lambda: self._clone_stopped(output_dir))
     
     def _progress_callback(self, progress: CloneProgress):
         """Handle progress updates from cloner"""
@@ -252,7 +263,9 @@ class WebsiteClonerGUI:
             self.root.after(0, lambda: self.log_message(f"Downloading: {filename}"))
         
         # Update status bar
-        status_text = f"Downloaded: {progress.downloaded_files}, Failed: {progress.failed_files}"
+        status_text = (f"Downloaded: {progress.downloaded_files}, Failed: {progress.failed_files}, "
+                       f"Write queue: {progress.write_queue_depth}, "
+                       f"Disk: {progress.write_bytes_per_sec / 1024 / 1024:.1f} MB/s")
         self.root.after(0, lambda: self.status_bar.config(text=status_text))
     
     def _clone_completed(self, result_dir):
@@ -272,6 +285,14 @@ class WebsiteClonerGUI:
                               f"Website cloned successfully to:\n{result_dir}\n\nOpen the folder now?"):
             self.open_output_folder()
     
+    def _clone_stopped(self, result_dir):
+        """Handle a clone that was stopped by the user"""
+        self.start_button.config(state=tk.NORMAL)
+        self.stop_button.config(state=tk.DISABLED)
+        self.open_button.config(state=tk.NORMAL)
+        self.status_var.set("Clone stopped")
+        self.log_message(f"Clone stopped. Files downloaded so far are in: {result_dir}")
+    
     def _clone_failed(self, error_message):
         """Handle clone failure"""
         self.is_cloning = False
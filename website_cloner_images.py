@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Website Cloner Responsive Images
+
+Parses srcset and sizes attributes and picks the image variant a browser
+would use for a given viewport width and device pixel ratio, so that a
+clone can fetch one file per image instead of every resolution.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+# (url, descriptor) where descriptor is e.g. '480w', '2x' or ''
+Candidate = Tuple[str, str]
+
+_SEPARATORS = re.compile(r'[\s,]*')
+_URL = re.compile(r'\S+')
+_DESCRIPTOR = re.compile(r'[^,]*')
+_LENGTH = re.compile(r'^([\d.]+)(px|vw|em|rem)$')
+_MEDIA_WIDTH = re.compile(r'^\(\s*(min|max)-width\s*:\s*([\d.]+)(px|em|rem)\s*\)$')
+
+# Attributes used by common lazy-loading scripts
+LAZY_SRC_ATTRIBUTES = ('data-src', 'data-lazy-src', 'data-original')
+LAZY_SRCSET_ATTRIBUTES = ('data-srcset', 'data-lazy-srcset')
+
+# <picture> source types that current browsers display
+SUPPORTED_IMAGE_TYPES = {
+    'image/avif', 'image/webp', 'image/apng', 'image/png', 'image/jpeg',
+    'image/gif', 'image/svg+xml', 'image/bmp', 'image/x-icon'
+}
+
+def parse_srcset(srcset: str) -> List[Candidate]:
+    """Split a srcset attribute into (url, descriptor) candidates"""
+    candidates = []
+    position = 0
+    while True:
+        position = _SEPARATORS.match(srcset, position).end()
+        if position >= len(srcset):
+            return candidates
+        
+        url = _URL.match(srcset, position).group()
+        position += len(url)
+        descriptor = ''
+        if url.endswith(','):
+            # A trailing comma ends the candidate without descriptors
+            url = url.rstrip(',')
+        else:
+            descriptor = _DESCRIPTOR.match(srcset, position).group()
+            position += len(descriptor)
+        candidates.append((url, descriptor.strip()))
+
+def _descriptor_value(descriptor: str) -> Tuple[str, float]:
+    """Return ('w', width) or ('x', density); no descriptor means 1x"""
+    descriptor = descriptor.lower()
+    try:
+        if descriptor.endswith('w'):
+            return 'w', float(descriptor[:-1])
+        if descriptor.endswith('x'):
+            return 'x', float(descriptor[:-1])
+    except ValueError:
+        pass
+    return 'x', 1.0
+
+def _length_in_px(length: str, viewport_width: float) -> Optional[float]:
+    """Convert a sizes length to CSS pixels"""
+    match = _LENGTH.match(length.strip().lower())
+    if not match:
+        return None
+    value, unit = float(match.group(1)), match.group(2)
+    if unit == 'vw':
+        return value * viewport_width / 100
+    if unit in ('em', 'rem'):
+        return value * 16
+    return value
+
+def _media_matches(condition: str, viewport_width: float) -> Optional[bool]:
+    """Evaluate a (min-width) or (max-width) condition; None if unsupported"""
+    match = _MEDIA_WIDTH.match(condition.strip().lower())
+    if not match:
+        return None
+    bound = float(match.group(2)) * (16 if match.group(3) in ('em', 'rem') else 1)
+    if match.group(1) == 'min':
+        return viewport_width >= bound
+    return viewport_width <= bound
+
+def media_matches(media: str, viewport_width: float) -> bool:
+    """Evaluate a media query list for a screen of the given width. Features
+    other than min-width and max-width count as not matching."""
+    for query in media.lower().split(','):
+        parts = [part.strip() for part in query.split(' and ')]
+        if all(part in ('all', 'screen', 'only screen') or _media_matches(part, viewport_width)
+               for part in parts if part):
+            return True
+    return False
+
+def source_matches(media: Optional[str], source_type: Optional[str], viewport_width: float) -> bool:
+    """Check if a browser would use a <picture> source with these attributes"""
+    if media and not media_matches(media, viewport_width):
+        return False
+    return not source_type or source_type.split(';')[0].strip().lower() in SUPPORTED_IMAGE_TYPES
+
+def slot_width(sizes: Optional[str], viewport_width: float) -> float:
+    """Return the display width in CSS pixels selected by a sizes attribute"""
+    for entry in (sizes or '').split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        condition, _, length = entry.rpartition(' ') if entry.startswith('(') else ('', '', entry)
+        if condition and not _media_matches(condition, viewport_width):
+            continue
+        width = _length_in_px(length, viewport_width)
+        if width is not None:
+            return width
+    return viewport_width
+
+def select_variant(candidates: List[Candidate], sizes: Optional[str],
+                   viewport_width: float, dpr: float) -> Optional[Candidate]:
+    """Pick the smallest candidate that still covers the needed resolution,
+    or the largest one if none does"""
+    if not candidates:
+        return None
+    
+    valued = [(candidate, *_descriptor_value(candidate[1])) for candidate in candidates]
+    widths = [(candidate, value) for candidate, unit, value in valued if unit == 'w']
+    if widths:
+        needed = slot_width(sizes, viewport_width) * dpr
+        pool = widths
+    else:
+        needed = dpr
+        pool = [(candidate, value) for candidate, unit, value in valued]
+    
+    covering = [entry for entry in pool if entry[1] >= needed]
+    if covering:
+        return min(covering, key=lambda entry: entry[1])[0]
+    return max(pool, key=lambda entry: entry[1])[0]
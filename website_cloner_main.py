@@ -20,54 +20,233 @@ Usage:
 
 """
 
-import tkinter as tk
-from website_cloner_gui import WebsiteClonerGUI
 import sys
+import json
 import argparse
-from website_cloner import WebsiteCloner
+import contextlib
+import threading
 
-def main():
-    """Main entry point for the Website Cloner"""
+def build_parser():
+    """Build the command-line argument parser"""
     parser = argparse.ArgumentParser(description='Clone websites for offline viewing')
     parser.add_argument('--url', help='URL to clone')
     parser.add_argument('--output', help='Output directory')
     parser.add_argument('--depth', type=int, default=2, help='Maximum crawl depth (default: 2)')
     parser.add_argument('--no-gui', action='store_true', help='Run in command-line mode')
-    parser.add_argument('--assets', nargs='+', default=['html', 'css', 'js', 'images'], 
+    parser.add_argument('--assets', nargs='+', default=['html', 'css', 'js', 'images'],
                        help='Asset types to download (html, css, js, images, fonts, videos)')
+    parser.add_argument('--max-total-mb', type=float, help='Stop after downloading this many megabytes')
+    parser.add_argument('--max-time', type=float, help='Stop after this many seconds')
+    parser.add_argument('--max-size', nargs='+', default=[], metavar='TYPE=MB',
+                       help='Per-asset-type size limits, e.g. videos=50 documents=20')
+    parser.add_argument('--fsync', choices=['none', 'batch', 'always'], default='none',
+                       help='When to fsync written files (default: none)')
+    parser.add_argument('--responsive-images', choices=['best', 'all'], default='best',
+                       help='Fetch the best srcset variant per image or all of them (default: best)')
+    parser.add_argument('--viewport-width', type=int, default=1280,
+                       help='Viewport width in CSS pixels used to pick image variants (default: 1280)')
+    parser.add_argument('--dpr', type=float, default=1.0,
+                       help='Device pixel ratio used to pick image variants (default: 1.0)')
+    parser.add_argument('--no-preconnect', action='store_true',
+                       help="Do not open connections to asset hosts ahead of their first request")
+    parser.add_argument('--verify', metavar='CLONE_DIR',
+                       help='Check an existing clone against the sizes and hashes in its clone_info.json')
+    parser.add_argument('--repair', action='store_true',
+                       help='With --verify, refetch missing, truncated and modified files')
+    parser.add_argument('--progress', choices=['text', 'json', 'none'], default='text',
+                       help='Command-line progress output; json writes one event per line to stdout (default: text)')
+    return parser
+
+def run_cli(args, max_asset_sizes):
+    """Clone a website without the GUI. Returns the process exit code:
+    0 on success, 1 on a fatal error, 2 if the start page could not be
+    downloaded and 130 if interrupted."""
+    # Imported here so that --help and argument errors stay fast
+    from website_cloner import WebsiteCloner
     
-    args = parser.parse_args()
+    events = sys.stdout
     
-    if args.no_gui and args.url:
-        # Command-line mode
+    def json_event(event):
+        events.write(json.dumps(event) + "\n")
+        events.flush()
+    
+    def text_event(event):
+        if event['event'] == 'file':
+            print(f"Saved {event['url']} ({event['bytes']} bytes, {event['latency_ms']} ms)")
+        elif event['event'] == 'done':
+            print(f"Clone {event['status']}: {event['downloaded_files']} files, "
+                  f"{event['downloaded_bytes']} bytes, {event['failed_files']} failed, "
+                  f"{event['skipped_files']} skipped in {event['elapsed_s']}s")
+            print(f"Connection setup saved: {event['connection_ms_saved']} ms "
+                  f"({event['connection_ms_saved_per_page']} ms per page)")
+            print(f"Files saved to: {event['output_dir']}")
+    
+    event_callback = {'json': json_event, 'text': text_event}.get(args.progress)
+    
+    if args.progress == 'text':
         print("Website Cloner - Command Line Mode")
         print("=" * 40)
+    
+    cloner = WebsiteCloner()
+    cloner.fsync_policy = args.fsync
+    cloner.responsive_images = args.responsive_images
+    cloner.target_viewport_width = args.viewport_width
+    cloner.target_dpr = args.dpr
+    cloner.preconnect_hosts = not args.no_preconnect
+    
+    # Keep stdout pure JSON lines; other messages go to stderr
+    redirect = contextlib.redirect_stdout(sys.stderr) if args.progress == 'json' else contextlib.nullcontext()
+    errors = []
+    finished = threading.Event()
+    
+    def clone():
+        try:
+            cloner.clone_website(
+                url=args.url,
+                output_dir=args.output or 'cloned_sites',
+                max_depth=args.depth,
+                asset_types=args.assets,
+                max_total_bytes=int(args.max_total_mb * 1024 * 1024) if args.max_total_mb else None,
+                max_duration=args.max_time,
+                max_asset_sizes=max_asset_sizes,
+                event_callback=event_callback
+            )
+        except Exception as e:
+            errors.append(e)
+        finally:
+            finished.set()
+    
+    with redirect:
+        # Clone on a worker thread so that Ctrl-C stops it the way the GUI's
+        # Stop button does, keeping the files and clone_info.json so far
+        worker = threading.Thread(target=clone, name='clone', daemon=True)
+        worker.start()
+        interrupted = False
+        # An interrupted Thread.join() can report the thread as finished, so
+        # wait on an event instead
+        while not finished.is_set():
+            try:
+                finished.wait(0.2)
+                continue
+            except KeyboardInterrupt:
+                if interrupted:
+                    return 130  # a second Ctrl-C does not wait
+                interrupted = True
+            # Outside the handler, so a second Ctrl-C during cancel() is caught
+            try:
+                cloner.cancel()
+            except KeyboardInterrupt:
+                return 130
         
-        cloner = WebsiteCloner()
-        cloner.clone_website(
-            url=args.url,
-            output_dir=args.output or 'cloned_sites',
-            max_depth=args.depth,
-            asset_types=args.assets
-        )
-    else:
-        # GUI mode
+        if errors:
+            if args.progress == 'json':
+                json_event({'event': 'fatal', 'url': args.url, 'error': str(errors[0])})
+            else:
+                print(f"Error: {errors[0]}", file=sys.stderr)
+            return 1
+    
+    if interrupted:
+        return 130
+    if cloner.clone_status() == 'failed':
+        return 2
+    return 0
+
+def run_verify(args):
+    """Verify (and optionally repair) an existing clone. Returns the process
+    exit code: 0 if the clone is intact or was repaired, 2 if damage remains."""
+    from website_cloner import WebsiteCloner
+    
+    events = sys.stdout
+    
+    def json_event(event):
+        events.write(json.dumps(event) + "\n")
+        events.flush()
+    
+    def text_event(event):
+        if event['event'] == 'damaged':
+            print(f"{event['problem'].upper():<10} {event['path']}")
+        elif event['event'] == 'file':
+            print(f"Refetched {event['url']} ({event['bytes']} bytes)")
+        elif event['event'] == 'verified':
+            print(f"Checked {event['checked']} files ({event['bytes_hashed']} bytes hashed) "
+                  f"in {event['elapsed_s']}s: {event['intact']} intact, {event['missing']} missing, "
+                  f"{event['truncated']} truncated, {event['modified']} modified")
+            if event['unverified']:
+                print(f"{event['unverified']} files have no recorded hash")
+            if args.repair:
+                print(f"Repaired {event['repaired']} files, {event['repair_failed']} failed")
+    
+    event_callback = {'json': json_event, 'text': text_event}.get(args.progress)
+    
+    cloner = WebsiteCloner()
+    cloner.fsync_policy = args.fsync
+    cloner.responsive_images = args.responsive_images
+    cloner.target_viewport_width = args.viewport_width
+    cloner.target_dpr = args.dpr
+    
+    redirect = contextlib.redirect_stdout(sys.stderr) if args.progress == 'json' else contextlib.nullcontext()
+    with redirect:
         try:
-            root = tk.Tk()
-            app = WebsiteClonerGUI(root)
-            
-            print("Website Cloner Started")
-            print("=" * 30)
-            print("Enter a URL and click 'Start Cloning' to begin")
-            print("The application will download the website and all its assets")
-            print()
-            
-            root.mainloop()
-            
+            report = cloner.verify_clone(args.verify, repair=args.repair, event_callback=event_callback)
+        except KeyboardInterrupt:
+            return 130
         except Exception as e:
-            print(f"Error starting GUI: {e}")
-            print("Try running with --no-gui flag for command-line mode")
-            sys.exit(1)
+            if args.progress == 'json':
+                json_event({'event': 'fatal', 'output_dir': args.verify, 'error': str(e)})
+            else:
+                print(f"Error: {e}", file=sys.stderr)
+            return 1
+    
+    if report.repair_failed or (report.damaged() and not args.repair):
+        return 2
+    return 0
+
+def run_gui():
+    """Start the graphical interface"""
+    try:
+        # Tk is only needed here, so headless installs never import it
+        import tkinter as tk
+        from website_cloner_gui import WebsiteClonerGUI
+        
+        root = tk.Tk()
+        app = WebsiteClonerGUI(root)
+        
+        print("Website Cloner Started")
+        print("=" * 30)
+        print("Enter a URL and click 'Start Cloning' to begin")
+        print("The application will download the website and all its assets")
+        print()
+        
+        root.mainloop()
+    
+    except Exception as e:
+        print(f"Error starting GUI: {e}")
+        print("Try running with --no-gui flag for command-line mode")
+        sys.exit(1)
+
+def main():
+    """Main entry point for the Website Cloner"""
+    parser = build_parser()
+    args = parser.parse_args()
+    
+    max_asset_sizes = {}
+    for limit in args.max_size:
+        asset_type, _, size = limit.partition('=')
+        try:
+            max_asset_sizes[asset_type] = int(float(size) * 1024 * 1024)
+        except ValueError:
+            parser.error(f"invalid --max-size value: {limit}")
+    
+    if args.verify:
+        sys.exit(run_verify(args))
+    elif args.no_gui:
+        if not args.url:
+            parser.error("--url is required with --no-gui")
+        # Command-line mode
+        sys.exit(run_cli(args, max_asset_sizes))
+    else:
+        # GUI mode
+        run_gui()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Website Cloner Networking
+
+A requests transport adapter that caches DNS lookups and can open
+connections to asset hosts ahead of time. It also keeps per-host statistics
+on connection reuse and handshake time.
+"""
+
+import socket
+import ssl
+import threading
+import time
+import urllib.parse
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util.timeout import Timeout
+from urllib3.util.wait import wait_for_read
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+def host_key(host: str, port: int) -> str:
+    """Name a host the way statistics are reported"""
+    return f"{host}:{port}"
+
+class DNSCache:
+    """Caches getaddrinfo results for a fixed time"""
+    
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        # (host, port) -> (expiry, addresses, seconds the lookup took)
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[tuple], float]] = {}
+        self._lock = threading.Lock()
+    
+    def resolve(self, host: str, port: int) -> Tuple[List[tuple], float, bool]:
+        """Return (address info, lookup seconds, cached) for host, looking it
+        up only when the entry expired. For a cache hit, the seconds are
+        those of the lookup that was avoided."""
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] > now:
+            return entry[1], entry[2], True
+        
+        started = time.monotonic()
+        addresses = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        seconds = time.monotonic() - started
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, addresses, seconds)
+        return addresses, seconds, False
+    
+    def forget(self, host: str, port: int):
+        """Drop a cached entry, e.g. after its addresses stopped answering"""
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+@dataclass
+class HostStats:
+    """Connection statistics for a single host"""
+    requests: int = 0
+    connections: int = 0
+    preconnects: int = 0
+    warm_hits: int = 0  # requests that found a pre-warmed connection waiting
+    failed_connections: int = 0
+    connect_ms: float = 0.0
+    warm_saved_ms: float = 0.0  # setup time of the pre-warmed connections that were used
+    dns_lookups: int = 0
+    dns_cache_hits: int = 0  # outside warm-ups, whose lookups are off the critical path anyway
+    dns_ms: float = 0.0
+    dns_saved_ms: float = 0.0
+    
+    @property
+    def avg_connect_ms(self) -> float:
+        return self.connect_ms / self.connections if self.connections else 0.0
+    
+    @property
+    def saved_ms(self) -> float:
+        """Setup time taken off the critical path by pre-warming and the DNS
+        cache. Keep-alive reuse is not counted; a plain session has it too."""
+        return self.warm_saved_ms + self.dns_saved_ms
+    
+    def summary(self) -> Dict[str, float]:
+        data = {key: round(value, 1) if isinstance(value, float) else value
+                for key, value in asdict(self).items()}
+        data['avg_connect_ms'] = round(self.avg_connect_ms, 1)
+        data['saved_ms'] = round(self.saved_ms, 1)
+        return data
+
+class ConnectionStats:
+    """Thread-safe per-host connection statistics"""
+    
+    def __init__(self):
+        self.hosts: Dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+    
+    def _host(self, host: str) -> HostStats:
+        stats = self.hosts.get(host)
+        if stats is None:
+            stats = self.hosts[host] = HostStats()
+        return stats
+    
+    def record_request(self, host: str):
+        with self._lock:
+            self._host(host).requests += 1
+    
+    def record_connect(self, host: str, seconds: float, preconnect: bool = False):
+        with self._lock:
+            stats = self._host(host)
+            stats.connections += 1
+            stats.connect_ms += seconds * 1000
+            if preconnect:
+                stats.preconnects += 1
+    
+    def record_warm_hit(self, host: str, connect_ms: float):
+        with self._lock:
+            stats = self._host(host)
+            stats.warm_hits += 1
+            stats.warm_saved_ms += connect_ms
+    
+    def record_failure(self, host: str):
+        with self._lock:
+            self._host(host).failed_connections += 1
+    
+    def record_dns(self, host: str, seconds: float, cached: bool, preconnect: bool = False):
+        with self._lock:
+            stats = self._host(host)
+            if not cached:
+                stats.dns_lookups += 1
+                stats.dns_ms += seconds * 1000
+            elif not preconnect:
+                stats.dns_cache_hits += 1
+                stats.dns_saved_ms += seconds * 1000
+    
+    def reset(self):
+        with self._lock:
+            self.hosts = {}
+    
+    def saved_ms(self) -> float:
+        """Estimated connection setup time avoided across all hosts"""
+        with self._lock:
+            return sum(stats.saved_ms for stats in self.hosts.values())
+    
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {host: stats.summary() for host, stats in sorted(self.hosts.items())}
+
+def _read_session_tickets(conn, wait: float = 0.05) -> bool:
+    """Consume the TLS 1.3 session tickets a server sends after the
+    handshake. Left unread, they make an idle connection look dropped to
+    the pool, which would then discard it. Returns False if the server
+    closed the connection or sent unexpected data."""
+    sock = conn.sock
+    if not isinstance(sock, ssl.SSLSocket):
+        return True
+    timeout = sock.gettimeout()
+    try:
+        sock.setblocking(False)
+        while wait_for_read(sock, timeout=wait):
+            try:
+                sock.recv(1)
+                return False
+            except ssl.SSLWantReadError:
+                continue
+    except OSError:
+        return False
+    finally:
+        sock.settimeout(timeout)
+    return True
+
+class ConnectionRegistry:
+    """Tracks open sockets so that blocked reads can be interrupted
+    
+    Sockets are tracked rather than connections: when a response will close
+    its connection, http.client hands the socket to the response and clears
+    conn.sock, but the socket can still be shut down from here.
+    """
+    
+    def __init__(self):
+        self._sockets = weakref.WeakSet()
+        self._lock = threading.Lock()
+    
+    def add(self, sock):
+        if isinstance(sock, socket.socket):
+            with self._lock:
+                self._sockets.add(sock)
+    
+    def abort(self):
+        """Shut down every tracked socket. Threads blocked in connect() or
+        recv() on them wake with an error or end of stream; the pools replace
+        the dead connections on their next use."""
+        with self._lock:
+            sockets = list(self._sockets)
+        for sock in sockets:
+            try:
+                # The plain socket method, so TLS state is left to the reader
+                socket.socket.shutdown(sock, socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+class _CachedConnectionMixin:
+    """Connects through the DNS cache and times connection setup"""
+    
+    dns_cache: DNSCache = None
+    stats: ConnectionStats = None
+    registry: ConnectionRegistry = None
+    preconnecting = threading.local()
+    _warm_ms: Optional[float] = None  # set while a pre-warmed connection awaits its first request
+    
+    def _is_preconnecting(self) -> bool:
+        return getattr(self.preconnecting, 'active', False)
+    
+    def _new_conn(self) -> socket.socket:
+        try:
+            addresses, seconds, cached = self.dns_cache.resolve(self._dns_host, self.port)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        self.stats.record_dns(host_key(self.host, self.port), seconds, cached,
+                              preconnect=self._is_preconnecting())
+        
+        timeout = Timeout.resolve_default_timeout(self.timeout)
+        error = None
+        for family, socktype, proto, _, address in addresses:
+            sock = None
+            try:
+                sock = socket.socket(family, socktype, proto)
+                for option in self.socket_options or []:
+                    sock.setsockopt(*option)
+                if timeout is not None:
+                    sock.settimeout(timeout)
+                if self.source_address:
+                    sock.bind(self.source_address)
+                self.registry.add(sock)
+                sock.connect(address)
+                return sock
+            except socket.timeout as e:
+                if sock is not None:
+                    sock.close()
+                raise ConnectTimeoutError(
+                    self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})"
+                ) from e
+            except OSError as e:
+                error = e
+                if sock is not None:
+                    sock.close()
+        
+        # None of the cached addresses answered; look the host up again next time
+        self.dns_cache.forget(self._dns_host, self.port)
+        raise NewConnectionError(self, f"Failed to establish a new connection: {error}")
+    
+    def connect(self):
+        started = time.monotonic()
+        preconnect = self._is_preconnecting()
+        try:
+            super().connect()
+        except Exception:
+            self.stats.record_failure(host_key(self.host, self.port))
+            raise
+        # TLS wraps the socket from _new_conn in a new object
+        self.registry.add(self.sock)
+        seconds = time.monotonic() - started
+        self._warm_ms = seconds * 1000 if preconnect else None
+        self.stats.record_connect(host_key(self.host, self.port), seconds, preconnect=preconnect)
+    
+    def request(self, *args, **kwargs):
+        if self._warm_ms is not None:
+            # The first request on a warmed connection skipped its whole setup
+            self.stats.record_warm_hit(host_key(self.host, self.port), self._warm_ms)
+            self._warm_ms = None
+        return super().request(*args, **kwargs)
+    
+    def close(self):
+        self._warm_ms = None
+        super().close()
+
+class WarmingAdapter(HTTPAdapter):
+    """HTTP adapter with a DNS cache and connection pre-warming"""
+    
+    def __init__(self, dns_cache: DNSCache = None, stats: ConnectionStats = None,
+                 preconnect_workers: int = 4, preconnect_timeout: float = 10.0, **kwargs):
+        self.dns_cache = dns_cache or DNSCache()
+        self.stats = stats or ConnectionStats()
+        self.registry = ConnectionRegistry()
+        self.preconnect_workers = preconnect_workers
+        self.preconnect_timeout = preconnect_timeout
+        self._executor = None
+        self._warming = set()
+        self._warming_lock = threading.Lock()
+        
+        attributes = {'dns_cache': self.dns_cache, 'stats': self.stats, 'registry': self.registry}
+        http_connection = type('CachedHTTPConnection', (_CachedConnectionMixin, HTTPConnection), attributes)
+        https_connection = type('CachedHTTPSConnection', (_CachedConnectionMixin, HTTPSConnection), attributes)
+        self._pool_classes = {
+            'http': type('CachedHTTPConnectionPool', (HTTPConnectionPool,), {'ConnectionCls': http_connection}),
+            'https': type('CachedHTTPSConnectionPool', (HTTPSConnectionPool,), {'ConnectionCls': https_connection}),
+        }
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+    
+    def send(self, request, *args, **kwargs):
+        parts = urllib.parse.urlsplit(request.url)
+        self.stats.record_request(host_key(parts.hostname, parts.port or DEFAULT_PORTS.get(parts.scheme)))
+        return super().send(request, *args, **kwargs)
+    
+    def preconnect(self, urls: Iterable[str], limit: int = 6, session: requests.Session = None):
+        """Open connections to the hosts of these URLs in the background.
+        
+        Pass the session that will make the requests: its verify, cert and
+        proxy settings, merged with the environment as for a real request,
+        select the pool the connection is put in.
+        """
+        origins = []
+        for url in urls:
+            parts = urllib.parse.urlsplit(url)
+            if parts.scheme in self._pool_classes and parts.netloc:
+                origin = f"{parts.scheme}://{parts.netloc}/"
+                if origin not in origins:
+                    origins.append(origin)
+        
+        for origin in origins[:limit]:
+            with self._warming_lock:
+                if origin in self._warming:
+                    continue
+                self._warming.add(origin)
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.preconnect_workers,
+                                                        thread_name_prefix='preconnect')
+            if session is not None:
+                settings = session.merge_environment_settings(origin, {}, None, None, None)
+            else:
+                settings = {'verify': True, 'cert': None, 'proxies': {}}
+            self._executor.submit(self._warm, origin, settings['verify'], settings['cert'], settings['proxies'])
+    
+    def _warm(self, origin: str, verify, cert, proxies):
+        """Make sure the pool for origin holds one open connection"""
+        try:
+            request = requests.Request('GET', origin).prepare()
+            if hasattr(self, 'get_connection_with_tls_context'):
+                pool = self.get_connection_with_tls_context(request, verify, proxies=proxies, cert=cert)
+            else:
+                pool = self.get_connection(origin, proxies)
+            
+            conn = pool._get_conn()
+            _CachedConnectionMixin.preconnecting.active = True
+            try:
+                if conn.sock is None:
+                    # Requests set their own timeouts on the connection later
+                    conn.timeout = self.preconnect_timeout
+                    conn.connect()
+                    if not _read_session_tickets(conn):
+                        conn.close()
+            except Exception:
+                # A failed warm-up costs nothing; the real request will retry
+                conn.close()
+            finally:
+                _CachedConnectionMixin.preconnecting.active = False
+                # Hand the connection back so the next request reuses it
+                pool._put_conn(conn)
+        except Exception:
+            pass
+        finally:
+            with self._warming_lock:
+                self._warming.discard(origin)
+    
+    def abort(self):
+        """Interrupt every request in flight, e.g. when a clone is cancelled"""
+        self.registry.abort()
+    
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        super().close()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Website Cloner Range Downloads
+
+Downloads large files as parallel byte ranges into a preallocated file and
+keeps a record of finished ranges, so an interrupted download can resume
+where it stopped instead of starting over.
+"""
+
+import os
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+PART_SUFFIX = '.part'
+STATE_SUFFIX = '.part.json'
+
+def supports_ranges(headers) -> bool:
+    """Check if a response allows byte-range requests on its raw body"""
+    if headers.get('accept-ranges', '').lower() != 'bytes':
+        return False
+    # Ranges address the encoded body, which requests would decode for us
+    return headers.get('content-encoding', 'identity').lower() in ('', 'identity')
+
+def _validators(headers) -> Dict[str, str]:
+    """Return the headers that identify a particular version of a file"""
+    return {key: headers[key] for key in ('etag', 'last-modified') if headers.get(key)}
+
+def _if_range(validators: Dict[str, str]) -> Optional[str]:
+    """Pick an If-Range value. Weak ETags are not allowed there (RFC 7233),
+    and servers treat them as a changed file."""
+    etag = validators.get('etag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return validators.get('last-modified')
+
+class RangesNotSupported(Exception):
+    """The server answered a range request with something other than 206"""
+
+class RangeDownloader:
+    """Fetches one file as parallel byte ranges with resumable progress"""
+    
+    def __init__(self, session, url: str, local_path: str, size: int, headers,
+                 segment_size: int = 4 * 1024 * 1024, workers: int = 4,
+                 chunk_size: int = 64 * 1024, timeout: float = 30,
+                 retries: int = 2, should_stop: Optional[Callable[[], bool]] = None):
+        self.session = session
+        self.url = url
+        self.local_path = local_path
+        self.part_path = local_path + PART_SUFFIX
+        self.state_path = local_path + STATE_SUFFIX
+        self.size = size
+        self.validators = _validators(headers)
+        self.segment_size = segment_size
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.retries = retries
+        self.should_stop = should_stop or (lambda: False)
+        
+        self.segment_count = (size + segment_size - 1) // segment_size
+        self.completed = set()
+        self.fetched_bytes = 0  # bytes transferred by this run, excluding resumed ranges
+        self._lock = threading.Lock()
+        self._fd = None
+        self._refused = False  # set once a range request is answered without 206
+    
+    def download(self) -> bool:
+        """Fetch every missing range. Returns True once the file is complete,
+        or False if stopped early with progress saved for a later resume.
+        
+        Raises RangesNotSupported, after removing the partial file, when the
+        server will not serve ranges of this version; fetch it whole instead.
+        """
+        self._load_state()
+        
+        if not os.path.exists(self.part_path):
+            self.completed.clear()
+        # Preallocate so that every range can be written in place
+        with open(self.part_path, 'ab') as f:
+            f.truncate(self.size)
+        
+        pending = [i for i in range(self.segment_count) if i not in self.completed]
+        self._fd = os.open(self.part_path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                # Surface the first error after the other segments settle
+                for future in [executor.submit(self._fetch_segment, i) for i in pending]:
+                    future.result()
+        except RangesNotSupported:
+            # Ranges saved so far may belong to an older version of the file
+            self.completed.clear()
+            raise
+        finally:
+            os.close(self._fd)
+            self._fd = None
+            if not self.completed:
+                self._discard()
+        
+        if len(self.completed) < self.segment_count:
+            return False
+        
+        os.replace(self.part_path, self.local_path)
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+        return True
+    
+    def _fetch_segment(self, index: int):
+        """Fetch one range, retrying transient failures"""
+        start = index * self.segment_size
+        end = min(start + self.segment_size, self.size) - 1
+        
+        for attempt in range(self.retries + 1):
+            if self.should_stop() or self._refused:
+                return
+            try:
+                if self._fetch_range(start, end):
+                    self._mark_completed(index)
+                return
+            except RangesNotSupported:
+                self._refused = True
+                raise
+            except Exception:
+                if attempt == self.retries:
+                    raise
+    
+    def _fetch_range(self, start: int, end: int) -> bool:
+        """Write bytes start..end (inclusive) in place. Returns False if stopped."""
+        headers = {'Range': f'bytes={start}-{end}', 'Accept-Encoding': 'identity'}
+        validator = _if_range(self.validators)
+        if validator:
+            # The server answers 200 with the whole body if the file changed
+            headers['If-Range'] = validator
+        
+        with self.session.get(self.url, headers=headers, timeout=self.timeout, stream=True) as response:
+            if 200 <= response.status_code < 300 and response.status_code != 206:
+                raise RangesNotSupported(f"expected 206 Partial Content for range {start}-{end}, "
+                                         f"got {response.status_code}")
+            response.raise_for_status()
+            
+            offset = start
+            for chunk in response.raw.stream(self.chunk_size, decode_content=False):
+                if self.should_stop() or self._refused:
+                    return False
+                chunk = chunk[:end + 1 - offset]
+                self._write_at(offset, chunk)
+                offset += len(chunk)
+                with self._lock:
+                    self.fetched_bytes += len(chunk)
+                if offset > end:
+                    break
+        
+        if offset <= end:
+            raise ValueError(f"range {start}-{end} ended early at byte {offset}")
+        return True
+    
+    def _write_at(self, offset: int, data: bytes):
+        """Write data at an absolute file offset"""
+        if hasattr(os, 'pwrite'):
+            while data:
+                written = os.pwrite(self._fd, data, offset)
+                data = data[written:]
+                offset += written
+        else:
+            # No positional writes on this platform; serialize seek + write
+            with self._lock:
+                os.lseek(self._fd, offset, os.SEEK_SET)
+                while data:
+                    data = data[os.write(self._fd, data):]
+    
+    def _discard(self):
+        """Remove the partial file and its state when no range is worth keeping"""
+        for path in (self.part_path, self.state_path):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def _mark_completed(self, index: int):
+        """Record a finished range on disk"""
+        with self._lock:
+            self.completed.add(index)
+            self._save_state()
+    
+    def _load_state(self):
+        """Resume from a previous run if it was fetching the same file"""
+        try:
+            with open(self.state_path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if (state.get('url') == self.url and state.get('size') == self.size
+                and state.get('segment_size') == self.segment_size
+                and state.get('validators') == self.validators):
+            self.completed = {i for i in state.get('completed', []) if 0 <= i < self.segment_count}
+        elif os.path.exists(self.part_path):
+            # The file changed on the server; its old ranges are useless
+            os.remove(self.part_path)
+    
+    def _save_state(self):
+        """Write the list of finished ranges atomically"""
+        state = {
+            'url': self.url,
+            'size': self.size,
+            'segment_size': self.segment_size,
+            'validators': self.validators,
+            'completed': sorted(self.completed)
+        }
+        temp_path = self.state_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.state_path)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Website Cloner Trap Detection
+
+Spots crawler traps such as calendars, faceted search and session-ID URLs,
+which generate endless distinct links to nearly identical pages. Pages are
+fingerprinted with SimHash to find near-duplicates, and link URLs are
+checked against per-pattern counters, repeated path segments and
+query-string limits before they are crawled.
+"""
+
+import re
+import hashlib
+import urllib.parse
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Set
+
+# Query parameters that identify a visitor rather than content
+SESSION_PARAMS = {
+    'sid', 'sessionid', 'session_id', 'jsessionid', 'phpsessid',
+    'aspsessionid', 'cfid', 'cftoken', 'fbclid', 'gclid'
+}
+
+FINGERPRINT_BITS = 64
+FINGERPRINT_BLOCKS = 4  # catches any pair within 3 bits via one equal block
+BLOCK_BITS = FINGERPRINT_BITS // FINGERPRINT_BLOCKS
+
+def _is_session_param(name: str) -> bool:
+    name = name.lower()
+    return name in SESSION_PARAMS or name.startswith('utm_')
+
+def _generalize_segment(segment: str) -> str:
+    """Replace the variable parts of a path segment with placeholders"""
+    if re.fullmatch(r'[0-9a-fA-F-]{8,}', segment) and re.search(r'\d', segment):
+        return '{id}'
+    return re.sub(r'\d+', '{n}', segment)
+
+def simhash(text: str, ngram: int = 3) -> Optional[int]:
+    """64-bit SimHash of word n-grams, or None if the text is too short"""
+    words = re.findall(r'\w+', text.lower())
+    if len(words) < ngram:
+        return None
+    
+    shingles = {' '.join(words[i:i + ngram]) for i in range(len(words) - ngram + 1)}
+    bits = [
+        format(int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big'),
+               '064b')
+        for shingle in shingles
+    ]
+    
+    # Majority vote per bit position; counting columns keeps the loop in C
+    half = len(bits) / 2
+    fingerprint = 0
+    for column in zip(*bits):
+        fingerprint = (fingerprint << 1) | (column.count('1') > half)
+    return fingerprint
+
+class TrapDetector:
+    """Decides which discovered links are worth crawling"""
+    
+    def __init__(self, max_pages_per_pattern: int = 1000, max_query_variants: int = 50,
+                 max_repeated_segments: int = 2, near_duplicate_distance: int = 3,
+                 duplicates_per_trap: int = 5):
+        self.max_pages_per_pattern = max_pages_per_pattern
+        self.max_query_variants = max_query_variants
+        self.max_repeated_segments = max_repeated_segments
+        self.near_duplicate_distance = min(near_duplicate_distance, FINGERPRINT_BLOCKS - 1)
+        self.duplicates_per_trap = duplicates_per_trap
+        
+        self.pattern_counts: Counter = Counter()
+        self.duplicate_counts: Counter = Counter()
+        self.trap_patterns: Set[str] = set()
+        self.trapped_urls: Set[str] = set()
+        self.duplicate_pages: Dict[str, str] = {}  # url -> url of the page it duplicates
+        self._query_variants: Dict[str, Set[str]] = defaultdict(set)
+        self._accepted: Dict[str, str] = {}  # canonical key -> url
+        self._fingerprints: Dict[tuple, List[tuple]] = defaultdict(list)
+    
+    def url_pattern(self, url: str) -> str:
+        """Generalize a URL so that links differing only by IDs share a pattern"""
+        parsed = urllib.parse.urlparse(url)
+        path = '/'.join(_generalize_segment(segment) for segment in parsed.path.split('/'))
+        params = sorted({name for name, _ in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+                         if not _is_session_param(name)})
+        return parsed.netloc + path + ('?' + '&'.join(params) if params else '')
+    
+    def allow_link(self, url: str) -> bool:
+        """Check a discovered link; returns False for links that look like a trap"""
+        parsed = urllib.parse.urlparse(url)
+        query = urllib.parse.urlencode(sorted(
+            (name, value) for name, value in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+            if not _is_session_param(name)
+        ))
+        page_key = parsed.netloc + parsed.path
+        canonical = page_key + '?' + query
+        
+        accepted = self._accepted.get(canonical)
+        if accepted is not None:
+            # The same link again is fine; the same page under a new session ID is not
+            return accepted == url or self._reject(url)
+        
+        segments = Counter(segment for segment in parsed.path.split('/') if segment)
+        if segments and max(segments.values()) > self.max_repeated_segments:
+            return self._reject(url)
+        
+        pattern = self.url_pattern(url)
+        if pattern in self.trap_patterns or self.pattern_counts[pattern] >= self.max_pages_per_pattern:
+            return self._reject(url)
+        
+        variants = self._query_variants[page_key]
+        if query:
+            if len(variants) >= self.max_query_variants:
+                return self._reject(url)
+            variants.add(query)
+        
+        self.pattern_counts[pattern] += 1
+        self._accepted[canonical] = url
+        return True
+    
+    def check_page(self, url: str, text: str) -> bool:
+        """Fingerprint a fetched page. Returns True if it nearly duplicates an
+        earlier page, in which case its links should not be expanded."""
+        fingerprint = simhash(text)
+        if fingerprint is None:
+            return False
+        
+        mask = (1 << BLOCK_BITS) - 1
+        blocks = [(i, (fingerprint >> (i * BLOCK_BITS)) & mask) for i in range(FINGERPRINT_BLOCKS)]
+        for block in blocks:
+            for other, other_url in self._fingerprints[block]:
+                if bin(fingerprint ^ other).count('1') <= self.near_duplicate_distance:
+                    self._record_duplicate(url, other_url)
+                    return True
+        
+        for block in blocks:
+            self._fingerprints[block].append((fingerprint, url))
+        return False
+    
+    def _record_duplicate(self, url: str, original_url: str):
+        """Count a near-duplicate against its URL pattern"""
+        self.duplicate_pages[url] = original_url
+        pattern = self.url_pattern(url)
+        self.duplicate_counts[pattern] += 1
+        if self.duplicate_counts[pattern] >= self.duplicates_per_trap:
+            self.trap_patterns.add(pattern)
+    
+    def _reject(self, url: str) -> bool:
+        self.trapped_urls.add(url)
+        return False
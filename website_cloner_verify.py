@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Website Cloner Verification
+
+Checks a finished clone against the sizes and hashes recorded in its
+clone_info.json. Files are hashed in parallel; large files are read through
+a memory map so they are hashed without being copied into Python. Sizes are
+compared first, so truncated files are found without hashing them at all.
+"""
+
+import hashlib
+import mmap
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MMAP_THRESHOLD = 4 * 1024 * 1024  # bytes; smaller files are read in one call
+
+def hash_file(path: str, mmap_threshold: int = MMAP_THRESHOLD) -> Tuple[int, str]:
+    """Return (size, sha256 hex digest) of a file"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= mmap_threshold:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return size, hashlib.sha256(mapped).hexdigest()
+        return size, hashlib.sha256(f.read()).hexdigest()
+
+def _default_workers() -> int:
+    return min(32, (os.cpu_count() or 1) * 2)
+
+def hash_files(paths: Iterable[str], workers: Optional[int] = None,
+               mmap_threshold: int = MMAP_THRESHOLD) -> Dict[str, Tuple[int, str]]:
+    """Hash many files in parallel. Files that cannot be read are left out.
+    
+    hashlib releases the GIL while it digests, so threads hash on every core
+    without the start-up cost of worker processes.
+    """
+    paths = list(dict.fromkeys(paths))
+    
+    def try_hash(path):
+        try:
+            return path, hash_file(path, mmap_threshold)
+        except OSError:
+            return path, None
+    
+    with ThreadPoolExecutor(max_workers=workers or _default_workers()) as executor:
+        return {path: result for path, result in executor.map(try_hash, paths) if result}
+
+@dataclass
+class VerifyReport:
+    """Outcome of checking a clone against its manifest"""
+    checked: int = 0
+    intact: int = 0
+    bytes_hashed: int = 0
+    elapsed_s: float = 0.0
+    missing: List[str] = field(default_factory=list)
+    truncated: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    unverified: List[str] = field(default_factory=list)  # no hash recorded
+    repaired: List[str] = field(default_factory=list)
+    repair_failed: List[str] = field(default_factory=list)
+    
+    def damaged(self) -> List[str]:
+        """URLs whose local copy is missing, truncated or modified"""
+        return self.missing + self.truncated + self.modified
+    
+    def problem(self, url: str) -> Optional[str]:
+        for name in ('missing', 'truncated', 'modified'):
+            if url in getattr(self, name):
+                return name
+        return None
+
+def verify_files(clone_dir: str, files: Dict[str, Dict], workers: Optional[int] = None,
+                 mmap_threshold: int = MMAP_THRESHOLD) -> VerifyReport:
+    """Compare files on disk with manifest entries of the form
+    {url: {'path': relative path, 'size': bytes, 'sha256': hex digest}}"""
+    started = time.monotonic()
+    report = VerifyReport(checked=len(files))
+    
+    to_hash = {}
+    for url, entry in files.items():
+        path = os.path.join(clone_dir, *entry['path'].split('/'))
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            report.missing.append(url)
+            continue
+        
+        expected = entry.get('size')
+        if expected is not None and size < expected:
+            report.truncated.append(url)
+        elif expected is not None and size > expected:
+            report.modified.append(url)
+        elif not entry.get('sha256'):
+            report.unverified.append(url)
+        else:
+            to_hash[url] = path
+    
+    hashes = hash_files(to_hash.values(), workers, mmap_threshold)
+    for url, path in to_hash.items():
+        result = hashes.get(path)
+        if result is None:
+            report.missing.append(url)
+            continue
+        report.bytes_hashed += result[0]
+        if result[1] == files[url]['sha256']:
+            report.intact += 1
+        else:
+            report.modified.append(url)
+    
+    report.elapsed_s = round(time.monotonic() - started, 3)
+    return report
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Website Cloner Disk Writer
+
+Moves file writes off the fetching thread. Completed downloads are queued
+and written by background threads, so slow or network disks do not stall
+the crawl. The queue is bounded: when it is full, fetchers wait for the
+writers to catch up.
+"""
+
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Set
+
+FSYNC_POLICIES = ('none', 'batch', 'always')
+
+@dataclass
+class WriterStats:
+    """Snapshot of disk writer activity"""
+    queue_depth: int = 0
+    files_written: int = 0
+    bytes_written: int = 0
+    write_errors: int = 0
+    bytes_per_second: float = 0.0  # over wall-clock time since the writer started
+
+class DiskWriter:
+    """Bounded write-behind queue drained by writer threads"""
+    
+    def __init__(self, workers: int = 2, max_queue: int = 64, fsync: str = 'none',
+                 fsync_batch: int = 32, on_error: Optional[Callable[[str, str, Exception], None]] = None):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {', '.join(FSYNC_POLICIES)}")
+        
+        self.fsync = fsync
+        self.fsync_batch = fsync_batch
+        self.on_error = on_error
+        
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._created_dirs: Set[str] = set()
+        self._dir_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._unsynced: List[str] = []
+        self._files_written = 0
+        self._bytes_written = 0
+        self._write_errors = 0
+        self._started = time.monotonic()
+        self._stopped = None  # set by close(), so the rate stops changing
+        
+        self._threads = [
+            threading.Thread(target=self._run, name=f"disk-writer-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+    
+    def ensure_dir(self, directory: str):
+        """Create a directory once; later calls for it are a set lookup"""
+        if not directory or directory in self._created_dirs:
+            return
+        with self._dir_lock:
+            if directory not in self._created_dirs:
+                os.makedirs(directory, exist_ok=True)
+                self._created_dirs.add(directory)
+    
+    def write(self, path: str, data: bytes, url: str = ""):
+        """Queue data to be written to path, blocking while the queue is full"""
+        self._queue.put((path, data, url))
+    
+    def flush(self):
+        """Wait until every queued write is on disk"""
+        self._queue.join()
+        if self.fsync == 'batch':
+            self._sync_pending()
+    
+    def close(self):
+        """Flush and stop the writer threads"""
+        self.flush()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._stopped = time.monotonic()
+    
+    def stats(self) -> WriterStats:
+        """Return current queue depth and throughput
+        
+        Throughput is taken over wall-clock time rather than summed busy
+        time, which would report the speed of a single writer thread.
+        """
+        elapsed = (self._stopped or time.monotonic()) - self._started
+        with self._stats_lock:
+            return WriterStats(
+                queue_depth=self._queue.qsize(),
+                files_written=self._files_written,
+                bytes_written=self._bytes_written,
+                write_errors=self._write_errors,
+                bytes_per_second=self._bytes_written / elapsed if elapsed > 0 else 0.0
+            )
+    
+    def _run(self):
+        """Writer thread loop"""
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._write_file(*job)
+            finally:
+                self._queue.task_done()
+    
+    def _write_file(self, path: str, data: bytes, url: str):
+        """Write one file and apply the fsync policy"""
+        try:
+            self.ensure_dir(os.path.dirname(path))
+            with open(path, 'wb') as f:
+                f.write(data)
+                if self.fsync == 'always':
+                    f.flush()
+                    os.fsync(f.fileno())
+        except Exception as e:
+            with self._stats_lock:
+                self._write_errors += 1
+            if self.on_error:
+                self.on_error(path, url, e)
+            return
+        
+        sync_batch = None
+        with self._stats_lock:
+            self._files_written += 1
+            self._bytes_written += len(data)
+            if self.fsync == 'batch':
+                self._unsynced.append(path)
+                if len(self._unsynced) >= self.fsync_batch:
+                    sync_batch, self._unsynced = self._unsynced, []
+        
+        if sync_batch:
+            self._sync_files(sync_batch)
+    
+    def _sync_pending(self):
+        """fsync files written since the last batch"""
+        with self._stats_lock:
+            sync_batch, self._unsynced = self._unsynced, []
+        self._sync_files(sync_batch)
+    
+    def _sync_files(self, paths: List[str]):
+        """fsync a batch of already closed files"""
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)